@@ -0,0 +1,104 @@
+"""Numba-compiled audio kernels for the voice assistant
+
+Imported lazily (on first audio init) so the Numba import and JIT cache load
+stay off the UI startup path. Callers fall back to NumPy/SciPy when Numba is not
+installed.
+"""
+
+import numba
+import numpy as np
+
+
+@numba.njit(cache=True, fastmath=True)
+def scale_int16(src, q15, dst):
+    """
+    Fused Q15 gain + int16 saturation in one pass (src and dst may alias)
+
+    Args:
+        src: int16 samples
+        q15: Gain as a Q15 integer (32768 == 1.0)
+        dst: int16 output, at least src.size long
+    """
+    for i in range(src.size):
+        v = (np.int32(src[i]) * q15) >> 15
+        if v > 32767:
+            v = 32767
+        elif v < -32768:
+            v = -32768
+        dst[i] = v
+
+
+def polyphase_taps(up: int, fir) -> np.ndarray:
+    """
+    Split a resample_poly FIR into polyphase branches for resample_int16
+
+    Args:
+        up: Upsampling factor
+        fir: Odd-length low-pass FIR designed at the upsampled rate
+
+    Returns:
+        float32 array of shape (up, taps_per_phase); row p holds fir[p::up]
+        scaled by up (resample_poly's passband gain), reversed so the inner
+        loop walks the input forwards
+    """
+    n_taps = -(-len(fir) // up)
+    padded = np.zeros(n_taps * up, dtype=np.float64)
+    padded[:len(fir)] = np.asarray(fir, dtype=np.float64) * up
+    return np.ascontiguousarray(padded.reshape(n_taps, up).T[:, ::-1], dtype=np.float32)
+
+
+@numba.njit(cache=True, boundscheck=False, fastmath=True)
+def resample_int16(src, taps, up, down, delay, pad, dst):
+    """
+    Zero-phase polyphase resampling of one int16 block (same output as
+    scipy.signal.resample_poly with the FIR the taps were built from)
+
+    Args:
+        src: int16 samples at the source rate
+        taps: Polyphase branches from polyphase_taps
+        up: Upsampling factor
+        down: Downsampling factor
+        delay: FIR group delay in upsampled samples ((len(fir) - 1) // 2)
+        pad: float32 scratch, at least src.size + 2 * taps.shape[1] long
+        dst: int16 output, at least ceil(src.size * up / down) long
+
+    Returns:
+        Number of samples written to dst
+    """
+    n_in = src.size
+    n_taps = taps.shape[1]
+    n_out = (n_in * up + down - 1) // down
+
+    # Zero-padded float copy of the block (into the caller's scratch, so no
+    # allocation): fixed-length inner loop, no bounds clamping, so LLVM can
+    # vectorize the multiply-accumulate
+    xp = pad
+    for i in range(n_taps):
+        xp[i] = 0.0
+        xp[n_taps + n_in + i] = 0.0
+    for i in range(n_in):
+        xp[n_taps + i] = src[i]
+
+    for k in range(n_out):
+        t = k * down + delay
+        row = taps[t % up]
+        base = t // up + 1  # xp index of the oldest input under this branch
+        acc = np.float32(0.0)
+        for j in range(n_taps):
+            acc += row[j] * xp[base + j]
+        v = np.rint(acc)
+        if v > 32767:
+            v = 32767
+        elif v < -32768:
+            v = -32768
+        dst[k] = np.int16(v)
+    return n_out
+
+
+def warm_up():
+    """Compile (or load from the on-disk cache) every kernel once"""
+    buf = np.zeros(16, dtype=np.int16)
+    scale_int16(buf, 16384, buf)
+    out = np.zeros(32, dtype=np.int16)
+    resample_int16(buf, np.zeros((2, 21), dtype=np.float32), 2, 1, 20,
+                   np.zeros(16 + 2 * 21, dtype=np.float32), out)
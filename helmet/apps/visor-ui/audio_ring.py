@@ -0,0 +1,120 @@
+"""Lock-free single-producer/single-consumer byte ring buffer for PCM audio"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _next_pow2(n: int) -> int:
+    """Smallest power of two >= n"""
+    return 1 << max(0, n - 1).bit_length()
+
+
+class SPSCByteRing:
+    """Pre-allocated byte ring buffer for one producer thread and one consumer thread
+
+    Head (read) and tail (write) are monotonically increasing plain ints: the
+    producer only ever stores tail and the consumer only ever stores head, and
+    CPython int loads/stores are atomic under the GIL, so no lock is needed.
+    Indices are mapped into the buffer with a single mask (capacity is a power
+    of two).
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity: Minimum buffer size in bytes (rounded up to a power of two)
+        """
+        self._capacity = _next_pow2(capacity)
+        self._mask = self._capacity - 1
+        self._buf = bytearray(self._capacity)
+        self._mv = memoryview(self._buf)
+        self._head = 0  # Next byte to read (consumer-owned)
+        self._tail = 0  # Next byte to write (producer-owned)
+
+    @property
+    def capacity(self) -> int:
+        """Buffer size in bytes"""
+        return self._capacity
+
+    def available(self) -> int:
+        """Number of bytes ready to be read"""
+        return self._tail - self._head
+
+    def free(self) -> int:
+        """Number of bytes that can be written without overflowing"""
+        return self._capacity - (self._tail - self._head)
+
+    def write(self, data) -> int:
+        """
+        Copy bytes into the ring (producer side)
+
+        Args:
+            data: Any bytes-like object
+
+        Returns:
+            Number of bytes written (less than len(data) if the ring is full)
+        """
+        src = memoryview(data).cast('B')
+        tail = self._tail
+        n = min(len(src), self._capacity - (tail - self._head))
+        if n <= 0:
+            return 0
+
+        start = tail & self._mask
+        first = min(n, self._capacity - start)
+        self._mv[start:start + first] = src[:first]
+        if n > first:
+            self._mv[:n - first] = src[first:n]
+
+        # Publish only after the bytes are in place
+        self._tail = tail + n
+        return n
+
+    def read_into(self, out, n: int) -> int:
+        """
+        Copy up to n bytes out of the ring (consumer side)
+
+        Args:
+            out: Writable buffer (bytearray / memoryview) of at least n bytes
+            n: Maximum number of bytes to read
+
+        Returns:
+            Number of bytes copied into out[:count]
+        """
+        head = self._head
+        n = min(n, self._tail - head)
+        if n <= 0:
+            return 0
+
+        dst = memoryview(out).cast('B')
+        start = head & self._mask
+        first = min(n, self._capacity - start)
+        dst[:first] = self._mv[start:start + first]
+        if n > first:
+            dst[first:n] = self._mv[:n - first]
+
+        # Release the space only after the bytes are copied out
+        self._head = head + n
+        return n
+
+    def discard(self, n: int) -> int:
+        """
+        Drop up to n of the oldest buffered bytes (consumer side)
+
+        Args:
+            n: Maximum number of bytes to drop
+
+        Returns:
+            Number of bytes dropped
+        """
+        head = self._head
+        n = min(n, self._tail - head)
+        if n <= 0:
+            return 0
+        self._head = head + n
+        return n
+
+    def reset(self):
+        """Discard all buffered bytes (consumer side)"""
+        self._head = self._tail
@@ -0,0 +1,68 @@
+"""Read-only Qt model exposing helmet configuration to QML"""
+
+import logging
+from typing import Any, Dict, List, Tuple
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt, QByteArray, Slot
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigModel(QAbstractListModel):
+    """Flattened, read-only view of the config tree (one row per dotted key)
+
+    QML reads individual values through value("video.width") or the key/value
+    roles, so the config dict is never converted wholesale into a QVariantMap.
+    """
+
+    KeyRole = Qt.UserRole + 1
+    ValueRole = Qt.UserRole + 2
+
+    def __init__(self, config, parent=None):
+        super().__init__(parent)
+        self._config = config
+        self._rows: List[Tuple[str, Any]] = []
+        self._index: Dict[str, int] = {}
+        self._flatten(config.all, "")
+        logger.info(f"Config model built with {len(self._rows)} keys")
+
+    def _flatten(self, node: Dict[str, Any], prefix: str):
+        """Collect leaf values under their dotted key paths"""
+        for key, value in node.items():
+            path = f"{prefix}{key}"
+            if isinstance(value, dict):
+                self._flatten(value, f"{path}.")
+            else:
+                self._index[path] = len(self._rows)
+                self._rows.append((path, value))
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+
+        key, value = self._rows[index.row()]
+        if role == self.KeyRole:
+            return key
+        if role in (self.ValueRole, Qt.DisplayRole):
+            return value
+        return None
+
+    def roleNames(self):
+        return {
+            self.KeyRole: QByteArray(b"key"),
+            self.ValueRole: QByteArray(b"value"),
+        }
+
+    @Slot(str, result='QVariant')
+    def value(self, key: str):
+        """Get a single config value by dotted key (None if missing)"""
+        row = self._index.get(key)
+        if row is None:
+            # Fall back to sub-tree lookups (e.g. "ui.hud")
+            return self._config.get(key)
+        return self._rows[row][1]
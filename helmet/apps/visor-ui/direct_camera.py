@@ -28,6 +28,7 @@ class DirectCamera:
         self.height = height
         self.fps = fps
         self.frame_count = 0
+        self.frame_callback = None  # Optional callable(frame_count), called from GStreamer thread
 
     def start(self):
         """Start camera capture using GStreamer"""
@@ -103,6 +104,8 @@ class DirectCamera:
                 self.current_frame = frame.copy()
                 self.frame_count += 1
 
+                frame_id = self.frame_count
+
                 # Debug: print first few frames
                 if self.frame_count <= 3:
                     print(f"Direct camera frame {self.frame_count}: {frame.shape}, dtype={frame.dtype}")
@@ -110,6 +113,11 @@ class DirectCamera:
             # Unmap buffer
             buf.unmap(map_info)
 
+            # Notify consumer that a new frame is ready
+            callback = self.frame_callback
+            if callback:
+                callback(frame_id)
+
             return Gst.FlowReturn.OK
 
         except Exception as e:
@@ -31,9 +31,9 @@ class HUDController:
             # Get telemetry from system monitor if available
             if self.system_monitor:
                 telemetry = self.system_monitor.get_telemetry()
-                cpu_usage = telemetry['cpu_usage']
-                memory_usage = telemetry['ram_usage']
-                temperature = telemetry['cpu_temp']
+                cpu_usage = telemetry.cpu_usage
+                memory_usage = telemetry.ram_usage
+                temperature = telemetry.cpu_temp
             else:
                 # Fallback to psutil
                 cpu_usage = self._get_cpu_usage()
@@ -10,9 +10,9 @@ from pathlib import Path
 from typing import Optional
 import os
 
-from PySide6.QtCore import QObject, Signal, QTimer, Property, QThread, QUrl, QSize, Slot
+from PySide6.QtCore import QObject, Qt, Signal, QTimer, Property, QThread, QUrl, QSize, Slot
 from PySide6.QtGui import QGuiApplication, QImage, QPixmap
-from PySide6.QtQml import qmlRegisterType, QQmlApplicationEngine, QQmlImageProviderBase
+from PySide6.QtQml import QmlElement, QQmlApplicationEngine, QQmlImageProviderBase
 from PySide6.QtQuick import QQuickView, QQuickImageProvider
 from PySide6.QtOpenGL import QOpenGLBuffer
 
@@ -43,10 +43,16 @@ from wake_word_detector import WakeWordDetector
 from gyro_sensor import GyroSensor
 from system_monitor import SystemMonitor
 from full_recorder import FullRecorder
+from config_model import ConfigModel
 
 import logging
 logger = logging.getLogger(__name__)
 
+# QML module for @QmlElement: PySide6 registers the decorated classes under
+# this import name when this module is imported (at runtime, not build time)
+QML_IMPORT_NAME = "HelmetUI"
+QML_IMPORT_MAJOR_VERSION = 1
+
 class VideoImageProvider(QQuickImageProvider):
     """Image provider for video frames"""
 
@@ -59,8 +65,9 @@ class VideoImageProvider(QQuickImageProvider):
         """Provide image to QML"""
         with self.lock:
             if not self.current_image.isNull():
-                # Return a copy to avoid threading issues
-                return self.current_image.copy()
+                # Images handed to setImage() own their pixels and are never
+                # mutated afterwards, so the implicitly-shared handle is safe
+                return self.current_image
             else:
                 # Return empty image if no frame available
                 empty = QImage(640, 480, QImage.Format_RGB888)
@@ -72,11 +79,12 @@ class VideoImageProvider(QQuickImageProvider):
         with self.lock:
             self.current_image = image
 
+@QmlElement
 class VisorApp(QObject):
     """Main visor application controller"""
 
     # Signals for QML
-    frameUpdated = Signal(str)  # Now passes image path
+    frameReady = Signal(int)  # New camera frame available (frame id)
     detectionsUpdated = Signal('QVariantList')
     hudStatusUpdated = Signal('QVariantMap')
     snapshotAnalyzed = Signal(str, str)  # snapshot path, analysis text
@@ -84,8 +92,14 @@ class VisorApp(QObject):
     captionReceived = Signal(str, bool)  # caption text, is_final
     orientationUpdated = Signal(float, float, float)  # heading, roll, pitch angles
 
+    # Cross-thread posts to the UI thread (queued connections, set up in __init__)
+    _cameraFrameArrived = Signal(int)  # From the GStreamer thread
+    _orientationArrived = Signal(float, float, float)  # From the sensor thread
+
     def __init__(self, config=None, image_provider=None, qml_window=None):
         super().__init__()
+        self._cameraFrameArrived.connect(self._update_frame, Qt.QueuedConnection)
+        self._orientationArrived.connect(self._emit_orientation_signal, Qt.QueuedConnection)
         self.config = config
         self.video_client = None
         self.direct_camera = None  # Direct GStreamer camera
@@ -93,6 +107,7 @@ class VisorApp(QObject):
         self.hud_controller = None
         self.running = False
         self.frame_counter = 0
+        self._frame_pending = False  # Coalesces camera -> UI thread frame posts
         self.qml_window = qml_window  # Reference to QML window for screen capture
 
         # Frame processing
@@ -170,7 +185,10 @@ class VisorApp(QObject):
             # Perception client
             perception_port = self.config.get('services.perception_port', 50052)
             print(f"Connecting to perception service at localhost:{perception_port}")
-            self.perception_client = PerceptionClient(f'localhost:{perception_port}')
+            self.perception_client = PerceptionClient(
+                f'localhost:{perception_port}',
+                shared_memory=self.config.get('perception.shared_memory', False),
+            )
             print("Perception client connected")
 
             # HUD controller (pass system monitor for real telemetry)
@@ -185,9 +203,7 @@ class VisorApp(QObject):
 
     def _setup_timers(self):
         """Setup update timers"""
-        # Frame update timer
-        self.frame_timer = QTimer()
-        self.frame_timer.timeout.connect(self._update_frame)
+        # Frames are pushed from the camera thread (see _on_camera_frame)
 
         # HUD update timer
         self.hud_timer = QTimer()
@@ -405,16 +421,8 @@ class VisorApp(QObject):
         roll = orientation_data['euler'][1] or 0.0  # Roll is index 1
         pitch = orientation_data['euler'][2] or 0.0  # Pitch is index 2
 
-        # Use QMetaObject.invokeMethod for thread-safe signal emission
-        from PySide6.QtCore import QMetaObject, Qt, Q_ARG
-        QMetaObject.invokeMethod(
-            self,
-            "_emit_orientation_signal",
-            Qt.QueuedConnection,
-            Q_ARG(float, heading),
-            Q_ARG(float, roll),
-            Q_ARG(float, pitch)
-        )
+        # Queued connection: _emit_orientation_signal runs on the UI thread
+        self._orientationArrived.emit(heading, roll, pitch)
 
     def _on_wake_word_detected(self, keyword: str):
         """Handle wake word detection"""
@@ -437,10 +445,9 @@ class VisorApp(QObject):
         self.running = True
 
         try:
-            # Start frame updates - using image provider for fast zero-copy updates
-            target_fps = 30  # 30 FPS for balanced performance
-            frame_interval = int(1000 / target_fps)
-            self.frame_timer.start(frame_interval)
+            # Start frame updates - camera pushes each new frame to the UI thread
+            if self.direct_camera:
+                self.direct_camera.frame_callback = self._on_camera_frame
 
             # Start HUD updates (lower frequency)
             print("Starting HUD timer")
@@ -503,9 +510,11 @@ class VisorApp(QObject):
     def stop(self):
         """Stop the visor application"""
         self.running = False
-        self.frame_timer.stop()
         self.hud_timer.stop()
 
+        if self.direct_camera:
+            self.direct_camera.frame_callback = None
+
         if self.voice_listener:
             self.voice_listener.stop()
 
@@ -535,8 +544,20 @@ class VisorApp(QObject):
 
         logger.info("Visor app stopped")
 
-    def _update_frame(self):
-        """Update video frame and run perception"""
+    def _on_camera_frame(self, frame_id: int):
+        """Handle new camera frame notification (called from GStreamer thread)"""
+        # Drop the post if the UI thread hasn't consumed the previous one yet
+        if self._frame_pending:
+            return
+        self._frame_pending = True
+
+        # Queued connection: _update_frame runs on the UI thread
+        self._cameraFrameArrived.emit(frame_id)
+
+    @Slot(int)
+    def _update_frame(self, frame_id: int):
+        """Update video frame and run perception (UI thread, once per new frame)"""
+        self._frame_pending = False
         if not self.running or not self.direct_camera:
             return
 
@@ -591,12 +612,12 @@ class VisorApp(QObject):
                     except Exception as e:
                         logger.error(f"Error capturing QML window: {e}")
 
-            # Use image provider for zero-copy frame updates (fastest)
+            # Publish the owned copy through the image provider; QML re-requests
+            # only when frameId changes, i.e. once per real camera frame
             if self.image_provider:
-                self.image_provider.setImage(qimage)
-                # Emit update signal with timestamp to trigger QML refresh
-                self.frameUpdated.emit(f"image://video/{self.frame_counter}")
-                self.frame_counter += 1
+                self.image_provider.setImage(self._current_qimage)
+                self.frame_counter = frame_id
+                self.frameReady.emit(frame_id)
 
             # Run perception inference (DISABLED - high CPU usage)
             # if self.perception_client:
@@ -608,35 +629,36 @@ class VisorApp(QObject):
 
     def _run_perception_async(self, frame_meta):
         """Run perception inference asynchronously"""
-        def run_perception():
-            try:
-                result = self.perception_client.infer(frame_meta)
-                if result and result.detections:
-                    detections = []
-                    for det in result.detections:
-                        detection_dict = {
-                            'x': det.x,
-                            'y': det.y,
-                            'width': det.width,
-                            'height': det.height,
-                            'label': det.label,
-                            'confidence': det.confidence
-                        }
-                        detections.append(detection_dict)
-
-                    self._current_detections = detections
-                    self.detectionsUpdated.emit(detections)
-                else:
-                    # Emit empty detections to clear overlay
-                    self.detectionsUpdated.emit([])
+        # Frames go out on one persistent InferStream; results arrive on its
+        # receiver thread. Fall back to a single non-blocking call if the
+        # frame could not be queued
+        if not self.perception_client.submit_frame(frame_meta, self._on_perception_result):
+            self.perception_client.infer_async(frame_meta, self._on_perception_result)
+
+    def _on_perception_result(self, result):
+        """Publish detections from a perception result (called from a gRPC thread)"""
+        try:
+            if result and result.detections:
+                detections = []
+                for det in result.detections:
+                    detection_dict = {
+                        'x': det.x,
+                        'y': det.y,
+                        'width': det.width,
+                        'height': det.height,
+                        'label': det.label,
+                        'confidence': det.confidence
+                    }
+                    detections.append(detection_dict)
 
-            except Exception as e:
-                logger.error(f"Perception error: {e}")
+                self._current_detections = detections
+                self.detectionsUpdated.emit(detections)
+            else:
+                # Emit empty detections to clear overlay
+                self.detectionsUpdated.emit([])
 
-        # Run in thread to avoid blocking UI
-        thread = threading.Thread(target=run_perception)
-        thread.daemon = True
-        thread.start()
+        except Exception as e:
+            logger.error(f"Perception error: {e}")
 
     def _update_hud(self):
         """Update HUD status information"""
@@ -685,6 +707,11 @@ class VisorApp(QObject):
             return self.hud_controller.get_status()
         return {}
 
+    @Property(int, notify=frameReady)
+    def frameId(self):
+        """Id of the latest frame held by the image provider"""
+        return self.frame_counter
+
     def _on_voice_command(self, command: str):
         """Handle voice commands"""
         logger.info(f"Voice command received: {command}")
@@ -873,11 +900,13 @@ def main():
     log_dir = Path(config.get('system.log_dir', 'logs'))
     setup_logging('visor-ui', log_level, log_dir)
 
-    # Create Qt application
-    app = QGuiApplication(sys.argv)
+    # Pin the platform plugin up front so Qt skips plugin probing at startup
+    # (explicit env from start_ui.sh / systemd still wins)
+    os.environ.setdefault("QT_QPA_PLATFORM", config.get('ui.qpa_platform', 'eglfs'))
+    os.environ.setdefault("QT_QUICK_BACKEND", "rhi")
 
-    # Register QML types
-    qmlRegisterType(VisorApp, 'HelmetUI', 1, 0, 'VisorApp')
+    # Create Qt application (pruned argv - no Qt flags to re-parse)
+    app = QGuiApplication(sys.argv[:1])
 
     # Create QML engine
     engine = QQmlApplicationEngine()
@@ -896,7 +925,9 @@ def main():
         sys.exit(1)
 
     # Set context properties BEFORE loading QML
-    engine.rootContext().setContextProperty("config", config.all)
+    # Config is exposed as a read-only model (no dict -> QVariantMap deep copy)
+    config_model = ConfigModel(config)
+    engine.rootContext().setContextProperty("config", config_model)
     engine.rootContext().setContextProperty("visorApp", visor_app)
 
     # Load QML with absolute path
@@ -2,20 +2,223 @@
 
 import os
 import asyncio
-import json
-import base64
+import binascii
+import functools
 import logging
+import time
+import traceback
 from typing import Optional
-import pyaudio
+import sounddevice as sd
+import random
 import threading
-import queue
+import concurrent.futures
+from collections import deque
+from fractions import Fraction
+
+import msgspec
+import numpy as np
+from scipy import signal as scipy_signal
+import httpx
+import websockets
+from openai import OpenAI, DefaultHttpxClient
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice
+from PySide6.QtGui import QImage
+
+from audio_ring import SPSCByteRing
+from phrase_matcher import PhraseMatcher
+from realtime_events import (
+    ServerEventDecoder,
+    AudioDelta,
+    ResponseDone,
+    TranscriptionCompleted,
+    TextDelta,
+    FunctionCallArgumentsDone,
+    ErrorEvent,
+)
+
+try:
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    TURBOJPEG_AVAILABLE = True
+except ImportError:
+    TURBOJPEG_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+try:
+    from ddgs import DDGS
+    DDGS_AVAILABLE = True
+except ImportError:
+    DDGS_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+if PYBASE64_AVAILABLE:
+    # SIMD (SSSE3/AVX2/NEON) decoder for the ~50 Hz audio delta stream
+    logger.info(f"pybase64 {pybase64.get_version()}")
+    _b64decode = pybase64.b64decode
+    _b64encode = pybase64.b64encode
+else:
+    # binascii directly: base64.b64encode/b64decode are Python wrappers around these
+    _b64decode = binascii.a2b_base64
+    _b64encode = functools.partial(binascii.b2a_base64, newline=False)
+
+
+def _polyphase_params(src_rate: int, dst_rate: int):
+    """
+    Integer up/down factors and anti-aliasing FIR for resample_poly
+
+    Args:
+        src_rate: Source sample rate in Hz
+        dst_rate: Target sample rate in Hz
+
+    Returns:
+        (up, down, fir) - fir matches resample_poly's default Kaiser design
+    """
+    ratio = Fraction(dst_rate, src_rate).limit_denominator(1000)
+    up, down = ratio.numerator, ratio.denominator
+    max_rate = max(up, down)
+    fir = scipy_signal.firwin(2 * 10 * max_rate + 1, 1.0 / max_rate, window=('kaiser', 5.0))
+    return up, down, fir
+
+
+# Sample rates that opened successfully, keyed by direction and device index
+_AUDIO_RATE_CACHE = os.path.expanduser("~/.cache/hvx/audio_rates.json")
+
+
+def _cached_first(rates: list, cached: Optional[int]) -> list:
+    """
+    Move a previously working rate to the front of a probe order
+
+    Args:
+        rates: Default probe order
+        cached: Rate from the cache, or None
+
+    Returns:
+        Probe order to use
+    """
+    if cached not in rates:
+        return rates
+    return [cached] + [r for r in rates if r != cached]
+
+
+# session.update template - tool schemas and audio settings are constant;
+# instructions/voice are filled in per instance by _build_session_config
+_BASE_SESSION_CONFIG = {
+    "type": "session.update",
+    "session": {
+        "modalities": ["text", "audio"],
+        "input_audio_format": "pcm16",
+        "output_audio_format": "pcm16",
+        "input_audio_transcription": {
+            "model": "whisper-1"  # Enable transcription for server-side VAD
+        },
+        "turn_detection": {  # Enable server-side VAD
+            "type": "server_vad",
+            "threshold": 0.95,  # Voice detection threshold (0.0-1.0) - very high to ignore assistant's own voice
+            "prefix_padding_ms": 300,  # Audio before speech starts
+            "silence_duration_ms": 1800,  # Silence to end turn (allow longer pauses in speech)
+        },
+        "temperature": 0.7,
+        "max_response_output_tokens": 200,  # Keep responses brief but useful
+        # Note: Vision support via gpt-4o model which supports multimodal inputs
+        "model": "gpt-4o-realtime-preview-2024-10-01",
+        "tools": [
+            {
+                "type": "function",
+                "name": "web_search",
+                "description": "Search the internet for current information, news, weather, facts, or any real-time data. Use this whenever you need up-to-date information you don't have.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "The search query"
+                        }
+                    },
+                    "required": ["query"]
+                }
+            },
+            {
+                "type": "function",
+                "name": "get_system_status",
+                "description": "Get current helmet system status including CPU usage, GPU usage, temperatures, RAM usage, power consumption, and FPS. Use this when the operator asks about system health, performance, temperatures, or resource usage.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {},
+                    "required": []
+                }
+            },
+            {
+                "type": "function",
+                "name": "start_recording",
+                "description": "Start video recording from the helmet camera. Records until stopped or duration limit reached. Use when operator says 'start recording', 'record video', 'begin recording', etc.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "duration_seconds": {
+                            "type": "number",
+                            "description": "Optional duration in seconds. If not specified, records until manually stopped."
+                        }
+                    },
+                    "required": []
+                }
+            },
+            {
+                "type": "function",
+                "name": "stop_recording",
+                "description": "Stop the current video recording and save the file. Use when operator says 'stop recording', 'end recording', 'save recording', etc.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {},
+                    "required": []
+                }
+            },
+            {
+                "type": "function",
+                "name": "get_recording_status",
+                "description": "Check if currently recording and get recording info (duration, frames). Use when operator asks 'are you recording', 'recording status', etc.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {},
+                    "required": []
+                }
+            }
+        ],
+        "tool_choice": "auto"  # Let model decide when to use tools
+    }
+}
+
 
 class OpenAIRealtimeAssistant:
     """Voice assistant using OpenAI Realtime API for low-latency speech-to-speech"""
 
+    # Constant outbound events (pre-serialized JSON)
+    _RESPONSE_CREATE = b'{"type":"response.create"}'
+    # input_audio_buffer.append is assembled around the base64 payload (which
+    # never needs JSON escaping)
+    _AUDIO_PREFIX = b'{"type":"input_audio_buffer.append","audio":"'
+    _AUDIO_SUFFIX = b'"}'
+    _FN_OUTPUT_TMPL = (
+        b'{"type":"conversation.item.create","item":'
+        b'{"type":"function_call_output","call_id":%s,"output":%s}}'
+    )
+
     def __init__(
         self,
         openai_api_key: str,
@@ -34,7 +237,7 @@ class OpenAIRealtimeAssistant:
         self.voice = voice
         self.input_device_index = input_device_index
         self.output_device_index = output_device_index
-        self.output_volume = max(0.0, min(1.0, output_volume))  # Clamp to 0.0-1.0
+        self.output_volume = output_volume  # Clamped to 0.0-1.0 by the setter
         self.wake_word_detector = wake_word_detector
         self.frame_getter = frame_getter  # On-demand frame capture
         self.system_monitor = system_monitor  # System telemetry
@@ -44,15 +247,58 @@ class OpenAIRealtimeAssistant:
         self.is_active = False  # Activated by wake word detection
         self.websocket = None
         self.thread = None
+        self.loop = None  # Assistant event loop (created in _run_assistant)
         self.send_audio_enabled = False  # Controls if we stream mic to OpenAI
-        self.is_playing_response = False  # Track if assistant is speaking
+        self._playing_response = False  # Track if assistant is speaking (see is_playing_response)
+        self._last_rtt_ms = None  # Websocket ping round-trip time
 
-        # Audio setup
-        self.audio = None
+        # Audio setup (sounddevice raw streams in callback mode - PortAudio threads feed the rings)
         self.input_stream = None
         self.output_stream = None
-        self.audio_queue = queue.Queue()
-        self.input_audio_buffer = queue.Queue()  # Buffer for microphone input
+        # Output ring: device-rate PCM16 from _play_audio, drained by the PortAudio output callback
+        self._out_ring = SPSCByteRing(1 << 15)
+        self._silence = memoryview(bytes(8192))  # Zeros for output underruns
+        # Playback ring: ~2.7s of 24kHz PCM16, filled by _handle_message, drained by _play_audio
+        self._ring = SPSCByteRing(1 << 17)
+        # Loop-bound events, created per loop in _run_assistant (start() after
+        # stop() runs a new loop); other threads set them via call_soon_threadsafe
+        self._audio_ready = None  # Set when the ring receives new audio
+        self._playback_drained = None  # Set by _play_audio when the ring runs empty
+        self._delta_accum = bytearray()  # Decoded deltas not yet in the ring (this iteration + overflow)
+        self._delta_backlog_max = 24000 * 2 * 30  # Cap overflow at ~30s of 24kHz PCM16 (drop oldest beyond)
+        self._delta_flush_pending = False
+        # Reusable playback chunk buffer (copied to the output ring via memoryview slices)
+        self._play_buf = bytearray(4096)
+        self._play_mv = memoryview(self._play_buf)
+        # Scratch arrays reused per chunk (sized for the largest probed device rate, 48kHz)
+        self._vol_scratch = np.empty(len(self._play_buf) // 2, dtype=np.int32)
+        self._out_scratch = np.empty(len(self._play_buf) // 2 * 2 + 1, dtype=np.int16)
+        self._in_scratch = np.empty(int(24000 * 0.02) + 1, dtype=np.int16)
+        self._background_tasks = set()  # Tasks posted from other threads via _post()
+        self._kernels = None  # audio_kernels module once loaded (False if Numba unavailable)
+        self._in_taps = None  # Polyphase branches for the Numba resampler (None = use resample_poly)
+        self._out_taps = None
+        self._in_pad = None  # Float scratch for the Numba resampler, sized per stream open
+        self._out_pad = None
+        # Per-chunk audio diagnostics (HVX_AUDIO_DEBUG=1); read once, off by default
+        self._debug_audio = os.environ.get('HVX_AUDIO_DEBUG', '0') == '1'
+        # Mic ring: 24kHz PCM16 from the input callback, drained by _send_audio.
+        # Holds ~2.7s; _send_audio keeps at most ~500ms queued (drop oldest).
+        self._mic_ring = SPSCByteRing(1 << 17)
+        self._mic_batch_ms = 100  # Mic audio per input_audio_buffer.append frame
+        self._mic_ready = None  # Set by the input callback when a batch is ready
+        # Text from other threads (Deepgram transcripts), drained by _drain_text
+        self._text_pending = deque()
+        self._text_ready = None
+        self._mic_backlog_bytes = int(24000 * 0.5) * 2  # 500ms of 24kHz PCM16
+
+        # Shared helpers for vision/search calls (reused across requests)
+        self._turbojpeg = None  # TurboJPEG encoder once created (False if unusable)
+        self._openai_client = None  # Lazy - created on first vision/TTS call
+        self._bg_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='assist-bg')
+        # Blocking PortAudio stream calls run here, one at a time and in order
+        self._audio_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='assist-audio')
+        self._audio_teardown = None  # Future of the last _tear_down_audio
 
         # Dismissal phrases
         self.dismissal_phrases = [
@@ -63,6 +309,71 @@ class OpenAIRealtimeAssistant:
             'goodbye', 'bye', 'see you later'
         ]
 
+        # Vision query phrases (trigger a camera frame analysis)
+        self.vision_keywords = [
+            "what do you see", "what am i looking at", "describe this",
+            "analyze this", "what is this", "look at", "can you see"
+        ]
+
+        # One automaton for both keyword sets, tagged by intent
+        self._keyword_matcher = PhraseMatcher({
+            **{phrase: "vision" for phrase in self.vision_keywords},
+            **{phrase: "dismiss" for phrase in self.dismissal_phrases},
+        }, ignore_case=True)
+
+        self._tool_args_decoder = msgspec.json.Decoder(dict)
+
+        # Realtime tool name -> (coroutine method, argument names it accepts)
+        self._tool_dispatch = {
+            "web_search": (self._web_search, ("query",)),
+            "get_system_status": (self._get_system_status, ()),
+            "start_recording": (self._start_recording, ("duration_seconds",)),
+            "stop_recording": (self._stop_recording, ()),
+            "get_recording_status": (self._get_recording_status, ()),
+        }
+
+        # Server event type -> handler (see _handle_message)
+        self._event_handlers = {
+            AudioDelta: self._on_audio_delta,
+            ResponseDone: self._on_response_done,
+            TranscriptionCompleted: self._on_transcription,
+            TextDelta: self._on_text_delta,
+            FunctionCallArgumentsDone: self._on_function_call,
+            ErrorEvent: self._on_error,
+        }
+
+        # Pre-serialized outbound events (identical on every send/reconnect)
+        self._json_encoder = msgspec.json.Encoder()
+        self._session_update_bytes = self._json_encoder.encode(self._build_session_config())
+        self._greeting_bytes = self._json_encoder.encode({
+            "type": "response.create",
+            "response": {
+                "modalities": ["text", "audio"],
+                "instructions": "Greet the user with just the word 'Sir' in a professional tone."
+            }
+        })
+        # User text item as prefix + <JSON string> + suffix, so only the text is encoded per send
+        text_item = self._json_encoder.encode({
+            "type": "conversation.item.create",
+            "item": {
+                "type": "message",
+                "role": "user",
+                "content": [
+                    {
+                        "type": "input_text",
+                        "text": "\x00"
+                    }
+                ]
+            }
+        })
+        self._text_item_prefix, self._text_item_suffix = text_item.split(b'"\\u0000"')
+        self._text_response_bytes = self._json_encoder.encode({
+            "type": "response.create",
+            "response": {
+                "modalities": ["text", "audio"]
+            }
+        })
+
         logger.info("OpenAI Realtime assistant initialized")
 
     def start(self):
@@ -71,6 +382,10 @@ class OpenAIRealtimeAssistant:
             return
 
         self.is_running = True
+        if self._bg_executor is None:
+            self._bg_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='assist-bg')
+        if self._audio_executor is None:
+            self._audio_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='assist-audio')
         self.thread = threading.Thread(target=self._run_assistant, daemon=True)
         self.thread.start()
         logger.info("OpenAI Realtime assistant started")
@@ -81,6 +396,13 @@ class OpenAIRealtimeAssistant:
         self.is_active = False
         if self.thread:
             self.thread.join(timeout=2)
+        if self._bg_executor:
+            self._bg_executor.shutdown(wait=False, cancel_futures=True)
+            self._bg_executor = None
+        if self._audio_executor:
+            # Queued stream teardown still runs so the device is released
+            self._audio_executor.shutdown(wait=False)
+            self._audio_executor = None
         logger.info("OpenAI Realtime assistant stopped")
 
     def activate(self):
@@ -88,8 +410,18 @@ class OpenAIRealtimeAssistant:
         self.is_active = True
         self.send_audio_enabled = True  # Start sending mic audio to OpenAI
 
+        # A previous deactivate may still be closing its streams: wait so the
+        # old streams release the device (and the wake word detector's resume
+        # happens) before new streams open
+        teardown = self._audio_teardown
+        if teardown is not None:
+            try:
+                teardown.result(timeout=5)
+            except Exception as e:
+                logger.warning(f"Audio teardown did not finish: {e}")
+
         # Initialize audio streams now (mic becomes available after wake word detector releases it)
-        if self.audio is None:
+        if self.output_stream is None:
             print("[OpenAI Assistant] Initializing audio streams...")
             self._init_audio_lazy()
 
@@ -98,10 +430,7 @@ class OpenAIRealtimeAssistant:
 
         # Send initial greeting
         if self.loop and self.websocket:
-            asyncio.run_coroutine_threadsafe(
-                self._send_greeting(),
-                self.loop
-            )
+            self._post(self._send_greeting())
 
     def deactivate(self):
         """Deactivate the assistant and resume wake word detection"""
@@ -109,50 +438,58 @@ class OpenAIRealtimeAssistant:
         self.is_active = False
         self.send_audio_enabled = False  # Stop sending mic audio to OpenAI
 
-        # Give async loops time to finish current operations
-        import time
-        time.sleep(0.2)
+        # Detach the streams now so nothing new is queued for them;
+        # the blocking PortAudio teardown runs on the audio executor
+        input_stream = self.input_stream
+        output_stream = self.output_stream
+        self.input_stream = None
+        self.output_stream = None
 
-        # Close audio streams to release microphone (in proper order)
-        if self.input_stream:
+        # Drop any buffered playback and microphone audio. reset() is a
+        # consumer-side operation, so it runs on the loop that drains the rings
+        loop = self.loop
+        if loop is not None and loop.is_running():
+            loop.call_soon_threadsafe(self._drop_buffered_audio)
+        else:
+            self._drop_buffered_audio()
+
+        if self._audio_executor:
+            self._audio_teardown = self._audio_executor.submit(
+                self._tear_down_audio, input_stream, output_stream)
+        else:
+            self._tear_down_audio(input_stream, output_stream)
+
+    def _drop_buffered_audio(self):
+        """Discard queued playback and mic audio (on the loop thread, the rings' consumer)"""
+        self._delta_accum.clear()
+        self._ring.reset()
+        self._mic_ring.reset()
+
+    def _tear_down_audio(self, input_stream, output_stream):
+        """Close detached audio streams, then hand the microphone back to the wake word detector"""
+        # Close audio streams to release microphone (in proper order).
+        # stop() waits for any running PortAudio callback to return.
+        if input_stream:
             print("[OpenAI Assistant] Closing input stream...")
             try:
-                self.input_stream.stop_stream()
+                input_stream.stop()
             except:
                 pass
             try:
-                self.input_stream.close()
+                input_stream.close()
             except:
                 pass
-            self.input_stream = None
 
-        if self.output_stream:
+        if output_stream:
             print("[OpenAI Assistant] Closing output stream...")
             try:
-                self.output_stream.stop_stream()
-            except:
-                pass
-            try:
-                self.output_stream.close()
+                output_stream.stop()
             except:
                 pass
-            self.output_stream = None
-
-        # Terminate PyAudio instance
-        if self.audio:
-            print("[OpenAI Assistant] Terminating PyAudio...")
             try:
-                self.audio.terminate()
+                output_stream.close()
             except:
                 pass
-            self.audio = None
-
-        # Clear audio queue
-        while not self.audio_queue.empty():
-            try:
-                self.audio_queue.get_nowait()
-            except:
-                break
 
         # Resume wake word detection
         if self.wake_word_detector:
@@ -161,57 +498,74 @@ class OpenAIRealtimeAssistant:
         print("[OpenAI Assistant] Deactivated - microphone released")
         logger.info("Assistant deactivated")
 
-
     def process_transcript(self, text: str):
         """Process a transcript from external source (Deepgram)"""
         if not self.is_active:
             return
 
         # Check for dismissal
-        text_lower = text.lower().strip()
-        if any(phrase in text_lower for phrase in self.dismissal_phrases):
+        if "dismiss" in self._keyword_matcher.find_tags(text):
             self.deactivate()
             # Send dismissal response
-            asyncio.run_coroutine_threadsafe(
-                self._send_text_message("Understood, Sir. I'll be here if you need me."),
-                self.loop
-            )
+            self._queue_text("Understood, Sir. I'll be here if you need me.")
             return
 
         # Send to OpenAI
-        asyncio.run_coroutine_threadsafe(
-            self._send_text_message(text),
-            self.loop
-        )
+        self._queue_text(text)
+
+    def _queue_text(self, text: str):
+        """Queue text for _drain_text from any thread (kept across reconnects)"""
+        self._text_pending.append(text)
+        if self.loop:
+            self.loop.call_soon_threadsafe(self._text_ready.set)
+
+    def _post(self, coro):
+        """Fire-and-forget a coroutine onto the assistant loop from another thread"""
+        self.loop.call_soon_threadsafe(self._spawn, coro)
+
+    def _spawn(self, coro):
+        """Create a task on the loop thread, keeping a reference until it finishes"""
+        task = self.loop.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
 
     def _run_assistant(self):
         """Run the assistant in an async loop"""
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
+        # uvloop (libuv) cuts per-I/O overhead on the websocket audio traffic.
+        # Only this thread's loop is replaced - the global policy is left alone.
+        if UVLOOP_AVAILABLE:
+            loop = uvloop.new_event_loop()
+        else:
+            loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        # Fresh events for this loop, in place before self.loop is published
+        # to the threads that signal them
+        self._audio_ready = asyncio.Event()
+        self._playback_drained = asyncio.Event()
+        self._mic_ready = asyncio.Event()
+        self._text_ready = asyncio.Event()
+        self.loop = loop
 
         try:
             self.loop.run_until_complete(self._connect_and_run())
         except Exception as e:
             logger.error(f"Error in assistant loop: {e}")
-            import traceback
             traceback.print_exc()
 
     async def _connect_and_run(self):
-        """Connect to OpenAI Realtime API and run - with auto-reconnect"""
+        """Connect to OpenAI Realtime API and run - reconnects until stopped"""
         retry_count = 0
-        max_retries = 3
 
-        while self.is_running and retry_count < max_retries:
+        while self.is_running:
             try:
-                import websockets
-
                 # Setup audio (lazy init - no blocking here)
                 self._setup_audio()
 
                 # Connect to OpenAI Realtime API
                 url = "wss://api.openai.com/v1/realtime?model=gpt-4o-realtime-preview-2024-10-01"
 
-                print(f"[OpenAI] Connecting to Realtime API (attempt {retry_count + 1}/{max_retries})...")
+                print(f"[OpenAI] Connecting to Realtime API (attempt {retry_count + 1})...")
 
                 # CRITICAL: Add ping/pong for connection health + shorter timeout
                 async with websockets.connect(
@@ -220,8 +574,8 @@ class OpenAIRealtimeAssistant:
                         "Authorization": f"Bearer {self.openai_api_key}",
                         "OpenAI-Beta": "realtime=v1"
                     },
-                    ping_interval=20,  # Send ping every 20s
-                    ping_timeout=10,   # Timeout if no pong in 10s
+                    ping_interval=5,   # Send ping every 5s
+                    ping_timeout=3,    # Timeout if no pong in 3s - fail over fast on helmet Wi-Fi
                     close_timeout=5,   # Faster close
                 ) as ws:
                     self.websocket = ws
@@ -237,162 +591,168 @@ class OpenAIRealtimeAssistant:
                     # Start audio tasks
                     audio_output_task = asyncio.create_task(self._play_audio())
                     audio_input_task = asyncio.create_task(self._send_audio())
+                    latency_task = asyncio.create_task(self._latency_loop(ws))
+                    text_task = asyncio.create_task(self._drain_text())
 
                     # Handle WebSocket messages
+                    decoder = ServerEventDecoder()
                     try:
                         async for message in ws:
                             if not self.is_running:
                                 break
-                            await self._handle_message(json.loads(message))
+                            event = decoder.decode(message)
+                            if event is not None:
+                                await self._handle_message(event)
                     except websockets.exceptions.ConnectionClosed:
                         logger.info("WebSocket connection closed")
                         if self.is_running:
                             print("[OpenAI] Connection lost, will retry...")
+                    finally:
+                        # Cleanup - always, so a reconnect never runs two
+                        # consumers on the single-consumer audio rings
+                        audio_output_task.cancel()
+                        audio_input_task.cancel()
+                        latency_task.cancel()
+                        text_task.cancel()
+                        try:
+                            await audio_output_task
+                        except asyncio.CancelledError:
+                            pass
+                        try:
+                            await audio_input_task
+                        except asyncio.CancelledError:
+                            pass
+                        try:
+                            await latency_task
+                        except asyncio.CancelledError:
+                            pass
+                        try:
+                            await text_task
+                        except asyncio.CancelledError:
+                            pass
 
-                    # Cleanup
-                    audio_output_task.cancel()
-                    audio_input_task.cancel()
-                    try:
-                        await audio_output_task
-                    except asyncio.CancelledError:
-                        pass
-                    try:
-                        await audio_input_task
-                    except asyncio.CancelledError:
-                        pass
-
-            except ImportError:
-                logger.error("websockets package not installed. Install: pip install websockets")
-                print("ERROR: Install websockets: pip install websockets")
-                break
             except Exception as e:
                 retry_count += 1
                 logger.error(f"Error in Realtime API connection: {e}")
-                import traceback
                 traceback.print_exc()
 
-                if self.is_running and retry_count < max_retries:
-                    wait_time = min(2 ** retry_count, 10)  # Exponential backoff, max 10s
-                    print(f"[OpenAI] Retrying in {wait_time}s...")
+                if self.is_running:
+                    # Honor the server's Retry-After, otherwise exponential backoff
+                    # with full jitter so helmets on one network don't retry in lockstep
+                    wait_time = self._retry_after_seconds(e)
+                    if wait_time is None:
+                        wait_time = random.uniform(0, min(2 ** retry_count, 60))
+                    print(f"[OpenAI] Retrying in {wait_time:.1f}s...")
                     await asyncio.sleep(wait_time)
             finally:
                 self._cleanup_audio()
 
-        if retry_count >= max_retries:
-            print(f"[OpenAI] Failed to connect after {max_retries} attempts")
-            logger.error(f"Failed to connect after {max_retries} attempts")
+    async def _latency_loop(self, ws):
+        """Publish the websocket round-trip time measured by the keepalive pings"""
+        try:
+            while self.is_running:
+                await asyncio.sleep(5)
+                self._last_rtt_ms = ws.latency * 1000
+                if self.system_monitor:
+                    self.system_monitor.set_link_rtt(self._last_rtt_ms)
+        finally:
+            # Connection gone - don't report a stale RTT
+            self._last_rtt_ms = None
+            if self.system_monitor:
+                self.system_monitor.set_link_rtt(None)
+
+    @staticmethod
+    def _retry_after_seconds(error: Exception) -> Optional[float]:
+        """Get the Retry-After delay from a rejected websocket handshake, if any"""
+        # websockets >= 14 raises InvalidStatus carrying the HTTP response
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers is None:
+            return None
+
+        retry_after = headers.get("Retry-After")
+        if retry_after is None:
+            return None
+        try:
+            return min(max(float(retry_after), 0.0), 300.0)
+        except ValueError:
+            return None  # HTTP-date form - fall back to backoff
 
     def _setup_audio(self):
-        """Setup PyAudio streams - LAZY INIT to avoid blocking on startup"""
-        # Don't initialize PyAudio here - defer until first audio playback
+        """Setup audio streams - LAZY INIT to avoid blocking on startup"""
+        # Don't open streams here - defer until first audio playback
         # This prevents USB audio device blocking during startup
-        self.audio = None
         self.output_stream = None
         logger.info("Audio setup deferred (lazy init on first playback)")
         print(f"[OpenAI Audio] Deferred initialization (lazy init)")
 
     def _cleanup_audio(self):
-        """Cleanup PyAudio streams"""
-        if self.input_stream:
-            self.input_stream.stop_stream()
-            self.input_stream.close()
-        if self.output_stream:
-            self.output_stream.stop_stream()
-            self.output_stream.close()
-        if self.audio:
-            self.audio.terminate()
+        """Cleanup audio streams"""
+        input_stream = self.input_stream
+        output_stream = self.output_stream
+        self.input_stream = None
+        self.output_stream = None
+        if input_stream:
+            input_stream.stop()
+            input_stream.close()
+        if output_stream:
+            output_stream.stop()
+            output_stream.close()
         logger.info("Audio streams cleaned up")
 
-    async def _configure_session(self):
-        """Configure the OpenAI Realtime session - with server VAD, vision, and web search support"""
-        config = {
-            "type": "session.update",
+    def _input_callback(self, indata, frames, time_info, status):
+        """PortAudio input callback: resample to 24kHz PCM16 into the mic ring"""
+        # Only capture while activated. The stream is stopped while the assistant
+        # speaks; the flag check covers blocks already in flight when it stops
+        if not self.send_audio_enabled or self._playing_response:
+            return
+
+        try:
+            audio_data = indata
+            if self.needs_resampling:
+                audio_np = np.frombuffer(indata, dtype=np.int16)
+                if self._in_taps is not None:
+                    n = self._kernels.resample_int16(
+                        audio_np, self._in_taps, self._in_up, self._in_down,
+                        (len(self._in_fir) - 1) // 2, self._in_pad, self._in_scratch
+                    )
+                    audio_data = self._in_scratch[:n]
+                else:
+                    audio_resampled = scipy_signal.resample_poly(
+                        audio_np, self._in_up, self._in_down, window=self._in_fir
+                    )
+                    np.clip(audio_resampled, -32768, 32767, out=audio_resampled)
+                    audio_data = self._in_scratch[:len(audio_resampled)]
+                    np.copyto(audio_data, audio_resampled, casting='unsafe')
+
+            self._mic_ring.write(audio_data)
+
+            # Wake _send_audio only once a full batch is buffered
+            if self._mic_ring.available() >= self._mic_batch_bytes:
+                self.loop.call_soon_threadsafe(self._mic_ready.set)
+        except Exception as e:
+            logger.error(f"Microphone callback error: {e}")
+
+    def _output_callback(self, outdata, frames, time_info, status):
+        """PortAudio output callback: copy device-rate PCM16 from the output ring, pad with silence"""
+        n = self._out_ring.read_into(outdata, len(outdata))
+        if n < len(outdata):
+            outdata[n:] = self._silence[:len(outdata) - n]
+
+    def _build_session_config(self) -> dict:
+        """Build the session.update event - with server VAD, vision, and web search support"""
+        return {
+            **_BASE_SESSION_CONFIG,
             "session": {
-                "modalities": ["text", "audio"],
+                **_BASE_SESSION_CONFIG["session"],
                 "instructions": self.system_prompt,
                 "voice": self.voice,
-                "input_audio_format": "pcm16",
-                "output_audio_format": "pcm16",
-                "input_audio_transcription": {
-                    "model": "whisper-1"  # Enable transcription for server-side VAD
-                },
-                "turn_detection": {  # Enable server-side VAD
-                    "type": "server_vad",
-                    "threshold": 0.95,  # Voice detection threshold (0.0-1.0) - very high to ignore assistant's own voice
-                    "prefix_padding_ms": 300,  # Audio before speech starts
-                    "silence_duration_ms": 1800,  # Silence to end turn (allow longer pauses in speech)
-                },
-                "temperature": 0.7,
-                "max_response_output_tokens": 200,  # Keep responses brief but useful
-                # Note: Vision support via gpt-4o model which supports multimodal inputs
-                "model": "gpt-4o-realtime-preview-2024-10-01",
-                "tools": [
-                    {
-                        "type": "function",
-                        "name": "web_search",
-                        "description": "Search the internet for current information, news, weather, facts, or any real-time data. Use this whenever you need up-to-date information you don't have.",
-                        "parameters": {
-                            "type": "object",
-                            "properties": {
-                                "query": {
-                                    "type": "string",
-                                    "description": "The search query"
-                                }
-                            },
-                            "required": ["query"]
-                        }
-                    },
-                    {
-                        "type": "function",
-                        "name": "get_system_status",
-                        "description": "Get current helmet system status including CPU usage, GPU usage, temperatures, RAM usage, power consumption, and FPS. Use this when the operator asks about system health, performance, temperatures, or resource usage.",
-                        "parameters": {
-                            "type": "object",
-                            "properties": {},
-                            "required": []
-                        }
-                    },
-                    {
-                        "type": "function",
-                        "name": "start_recording",
-                        "description": "Start video recording from the helmet camera. Records until stopped or duration limit reached. Use when operator says 'start recording', 'record video', 'begin recording', etc.",
-                        "parameters": {
-                            "type": "object",
-                            "properties": {
-                                "duration_seconds": {
-                                    "type": "number",
-                                    "description": "Optional duration in seconds. If not specified, records until manually stopped."
-                                }
-                            },
-                            "required": []
-                        }
-                    },
-                    {
-                        "type": "function",
-                        "name": "stop_recording",
-                        "description": "Stop the current video recording and save the file. Use when operator says 'stop recording', 'end recording', 'save recording', etc.",
-                        "parameters": {
-                            "type": "object",
-                            "properties": {},
-                            "required": []
-                        }
-                    },
-                    {
-                        "type": "function",
-                        "name": "get_recording_status",
-                        "description": "Check if currently recording and get recording info (duration, frames). Use when operator asks 'are you recording', 'recording status', etc.",
-                        "parameters": {
-                            "type": "object",
-                            "properties": {},
-                            "required": []
-                        }
-                    }
-                ],
-                "tool_choice": "auto"  # Let model decide when to use tools
             }
         }
 
-        await self.websocket.send(json.dumps(config))
+    async def _configure_session(self):
+        """Configure the OpenAI Realtime session (payload serialized once in __init__)"""
+        await self.websocket.send(self._session_update_bytes, text=True)
         logger.info("Session configured (server VAD + vision + web search enabled)")
 
     async def _get_system_status(self) -> str:
@@ -409,19 +769,19 @@ class OpenAIRealtimeAssistant:
             # Format concise status report
             status = (
                 f"System status: "
-                f"CPU {t['cpu_usage']:.0f}% at {t['cpu_temp']:.0f}°C, "
-                f"GPU {t['gpu_usage']:.0f}% at {t['gpu_temp']:.0f}°C, "
-                f"RAM {t['ram_usage']:.0f}% used, "
-                f"power draw {t['power_total_mw']/1000:.1f} watts"
+                f"CPU {t.cpu_usage:.0f}% at {t.cpu_temp:.0f}°C, "
+                f"GPU {t.gpu_usage:.0f}% at {t.gpu_temp:.0f}°C, "
+                f"RAM {t.ram_usage:.0f}% used, "
+                f"power draw {t.power_total_mw/1000:.1f} watts"
             )
 
             # Add warnings if needed
             warnings = []
-            if t['cpu_temp'] > 70:
+            if t.cpu_temp > 70:
                 warnings.append("CPU temperature elevated")
-            if t['gpu_temp'] > 70:
+            if t.gpu_temp > 70:
                 warnings.append("GPU temperature elevated")
-            if t['ram_usage'] > 85:
+            if t.ram_usage > 85:
                 warnings.append("RAM usage high")
 
             if warnings:
@@ -513,20 +873,20 @@ class OpenAIRealtimeAssistant:
     async def _web_search(self, query: str) -> str:
         """Perform web search using DuckDuckGo"""
         try:
+            if not DDGS_AVAILABLE:
+                return "Web search unavailable: ddgs package not installed."
+
             print(f"[Web Search] Searching for: {query}")
-            from ddgs import DDGS
 
-            # Run blocking search in executor
+            # Run blocking search on the shared background executor
             loop = asyncio.get_event_loop()
-            import concurrent.futures
-            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
 
             def do_search():
                 ddgs = DDGS()
                 results = list(ddgs.text(query, max_results=5))
                 return results
 
-            search_results = await loop.run_in_executor(executor, do_search)
+            search_results = await loop.run_in_executor(self._bg_executor, do_search)
 
             if not search_results:
                 return "No results found."
@@ -544,6 +904,18 @@ class OpenAIRealtimeAssistant:
             print(f"[Web Search Error] {error_msg}")
             return error_msg
 
+    def _get_openai_client(self):
+        """Get the shared OpenAI client (keeps its HTTP connection pool alive between calls)"""
+        if self._openai_client is None:
+            # One pooled connection to api.openai.com shared by vision and TTS
+            # requests (HTTP/2 multiplexed when h2 is installed)
+            http_client = DefaultHttpxClient(
+                http2=H2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=120),
+            )
+            self._openai_client = OpenAI(api_key=self.openai_api_key, http_client=http_client)
+        return self._openai_client
+
     async def _send_camera_frame(self):
         """Analyze current camera frame using GPT-4 Vision (Chat API) and speak the response"""
         if not self.frame_getter:
@@ -551,31 +923,22 @@ class OpenAIRealtimeAssistant:
             return
 
         try:
-            import tempfile
-            import os
-            from openai import OpenAI
-
             # Get current frame on-demand
             current_frame = self.frame_getter()
             if not current_frame:
                 print("[Vision] No camera frame available")
                 return
 
-            # Save frame to temporary file
-            temp_file = tempfile.NamedTemporaryFile(suffix='.jpg', delete=False)
-            temp_path = temp_file.name
-            temp_file.close()
-
-            if current_frame.save(temp_path, "JPG", 85):
-                # Read as base64
-                with open(temp_path, "rb") as f:
-                    img_data = base64.b64encode(f.read()).decode("utf-8")
-
+            img_data = self._encode_jpeg_b64(current_frame)
+            if img_data:
                 print(f"[Vision] Captured frame, sending to GPT-4 Vision...")
 
-                # Use OpenAI Chat Completions API for vision (Realtime API doesn't support images)
-                client = OpenAI(api_key=self.openai_api_key)
-                response = client.chat.completions.create(
+                # Use OpenAI Chat Completions API for vision (Realtime API doesn't support images).
+                # The sync SDK call runs on the background pool so playback and mic
+                # streaming keep running during the HTTP round-trip
+                client = self._get_openai_client()
+                response = await asyncio.get_running_loop().run_in_executor(self._bg_executor, functools.partial(
+                    client.chat.completions.create,
                     model="gpt-4o",
                     messages=[
                         {
@@ -599,7 +962,7 @@ class OpenAIRealtimeAssistant:
                         }
                     ],
                     max_tokens=150
-                )
+                ))
 
                 vision_description = response.choices[0].message.content
                 print(f"[Vision] GPT-4 Vision response: {vision_description}")
@@ -608,92 +971,128 @@ class OpenAIRealtimeAssistant:
                 # This keeps everything in one conversation flow
                 await self._send_vision_result(vision_description)
 
-                # Cleanup
-                os.unlink(temp_path)
-
         except Exception as e:
             logger.error(f"Error analyzing camera frame: {e}")
-            import traceback
             traceback.print_exc()
 
-    async def _send_vision_result(self, vision_text: str):
-        """Send vision analysis result to Realtime API to speak"""
-        if not self.websocket or not self.is_active:
-            return
+    def _encode_jpeg_b64(self, frame) -> Optional[str]:
+        """
+        Encode a camera frame as base64 JPEG (quality 85) in memory
 
-        try:
-            # Create a conversation item with the vision result
-            item = {
-                "type": "conversation.item.create",
-                "item": {
-                    "type": "message",
-                    "role": "assistant",  # Assistant describing what it sees
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": vision_text
-                        }
-                    ]
-                }
-            }
+        Args:
+            frame: QImage from the frame getter
 
-            await self.websocket.send(json.dumps(item))
-
-            # Request the model to speak this
-            response_request = {
-                "type": "response.create",
-                "response": {
-                    "modalities": ["audio"],  # Only audio, we already have the text
-                    "instructions": f"Say this exactly: {vision_text}"
-                }
-            }
+        Returns:
+            Base64 string, or None if encoding failed
+        """
+        if self._turbojpeg is None and TURBOJPEG_AVAILABLE:
+            try:
+                self._turbojpeg = TurboJPEG()
+            except Exception as e:  # Python bindings present but libturbojpeg missing
+                logger.warning(f"TurboJPEG unavailable, using Qt JPEG encoder: {e}")
+                self._turbojpeg = False
+
+        if self._turbojpeg:
+            # libjpeg-turbo SIMD encode straight from the QImage pixels (no copy)
+            rgb = frame.convertToFormat(QImage.Format_RGB888)
+            pixels = np.frombuffer(rgb.constBits(), dtype=np.uint8, count=rgb.sizeInBytes())
+            pixels = pixels.reshape(rgb.height(), rgb.bytesPerLine())[:, :rgb.width() * 3]
+            pixels = pixels.reshape(rgb.height(), rgb.width(), 3)
+            jpeg = self._turbojpeg.encode(pixels, quality=85, pixel_format=TJPF_RGB)
+            return _b64encode(jpeg).decode("ascii")
+
+        # Encode frame to JPEG in memory (no temp file round-trip)
+        jpeg_bytes = QByteArray()
+        buffer = QBuffer(jpeg_bytes)
+        buffer.open(QIODevice.WriteOnly)
+        saved = frame.save(buffer, "JPG", 85)
+        buffer.close()
+        if not saved:
+            return None
+
+        # Base64 inside Qt - the raw JPEG is never copied into a Python bytes
+        return jpeg_bytes.toBase64().data().decode("ascii")
 
-            await self.websocket.send(json.dumps(response_request))
-            print(f"[Vision] Sent to Realtime API for speaking")
+    async def _send_vision_result(self, vision_text: str):
+        """Speak vision analysis result via streaming TTS straight into the playback ring"""
+        if not self.is_active:
+            return
 
+        try:
+            await self._stream_speech(vision_text)
+            print(f"[Vision] Streamed TTS response")
         except Exception as e:
             logger.error(f"Error sending vision result: {e}")
 
-    async def _speak_text_directly_OLD(self, text: str):
-        """Speak text directly using OpenAI TTS (bypasses Realtime API conversation)"""
-        try:
-            from openai import OpenAI
+    async def _stream_speech(self, text: str):
+        """
+        Speak text with OpenAI TTS, feeding PCM to the playback ring as it arrives
 
-            print(f"[Vision TTS] Speaking: {text}")
+        The microphone stays blocked until the last chunk has been played.
+
+        Args:
+            text: Text to speak
+        """
+        loop = asyncio.get_running_loop()
+        client = self._get_openai_client()
 
-            # Generate speech using TTS API
-            client = OpenAI(api_key=self.openai_api_key)
-            response = client.audio.speech.create(
-                model="tts-1",  # Use fast model for low latency
+        def stream_tts():
+            # 24kHz 16-bit mono PCM - same format as Realtime audio deltas
+            with client.audio.speech.with_streaming_response.create(
+                model="tts-1",
                 voice=self.voice,
                 input=text,
-                response_format="pcm"  # Raw PCM for direct playback
-            )
+                response_format="pcm"
+            ) as response:
+                for chunk in response.iter_bytes(chunk_size=4096):
+                    if not self.is_active:
+                        break
+                    # Hand each chunk to the event loop so the ring keeps a single producer
+                    asyncio.run_coroutine_threadsafe(self._write_playback(chunk), loop).result()
 
-            # Get raw audio bytes
-            audio_bytes = response.content
+        try:
+            self.is_playing_response = True
+            await loop.run_in_executor(self._bg_executor, stream_tts)
+            await self._wait_playback_drained()
+        finally:
+            self.is_playing_response = False
 
-            # Play audio directly through output stream
-            if self.output_stream:
-                self.is_playing_response = True
+    async def _write_playback(self, data):
+        """Write PCM into the playback ring, waiting for free space when it is full"""
+        remaining = memoryview(data)
+        while remaining and self.is_running:
+            written = self._ring.write(remaining)
+            if written:
+                self._audio_ready.set()
+                remaining = remaining[written:]
+            else:
+                await asyncio.sleep(0.02)
 
-                # Write audio in chunks to avoid blocking
-                chunk_size = 4096
-                for i in range(0, len(audio_bytes), chunk_size):
-                    chunk = audio_bytes[i:i+chunk_size]
-                    self.audio_queue.put(chunk)
+    async def _wait_playback_drained(self):
+        """Wait until audio written to the playback ring has been played out"""
+        while self._ring.available() and self.output_stream and self.is_active:
+            self._playback_drained.clear()
+            try:
+                await asyncio.wait_for(self._playback_drained.wait(), 0.5)
+            except asyncio.TimeoutError:
+                pass  # Re-check: the ring may have been reset on deactivate
 
-                # Wait for playback to finish
-                import asyncio
-                while not self.audio_queue.empty():
-                    await asyncio.sleep(0.1)
+        # Whatever is left is already at device rate in the output ring
+        pending = self._out_ring.available()
+        if pending and self.output_stream:
+            await asyncio.sleep(pending / (2 * self.output_native_rate))
 
-                self.is_playing_response = False
+    async def _speak_text_directly_OLD(self, text: str):
+        """Speak text directly using OpenAI TTS (bypasses Realtime API conversation)"""
+        try:
+            print(f"[Vision TTS] Speaking: {text}")
+
+            if self.output_stream:
+                await self._stream_speech(text)
                 print("[Vision TTS] Playback complete")
 
         except Exception as e:
             logger.error(f"Error speaking text: {e}")
-            import traceback
             traceback.print_exc()
 
     async def _send_greeting(self):
@@ -703,257 +1102,274 @@ class OpenAIRealtimeAssistant:
 
         try:
             # Request a simple greeting response
-            response_request = {
-                "type": "response.create",
-                "response": {
-                    "modalities": ["text", "audio"],
-                    "instructions": "Greet the user with just the word 'Sir' in a professional tone."
-                }
-            }
-
-            await self.websocket.send(json.dumps(response_request))
+            await self.websocket.send(self._greeting_bytes, text=True)
             print(f"[OpenAI] Sending greeting...")
 
         except Exception as e:
             logger.error(f"Error sending greeting: {e}")
 
+    async def _drain_text(self):
+        """Send queued text messages; texts that pile up while one is sending go out as one message"""
+        while self.is_running:
+            if not self._text_pending:
+                self._text_ready.clear()
+                await self._text_ready.wait()
+                continue
+
+            parts = []
+            while self._text_pending:
+                parts.append(self._text_pending.popleft())
+            await self._send_text_message(" ".join(parts))
+
     async def _send_text_message(self, text: str):
         """Send a text message to OpenAI"""
         if not self.websocket or not self.is_active:
             return
 
         try:
-            # Create conversation item
-            item = {
-                "type": "conversation.item.create",
-                "item": {
-                    "type": "message",
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "input_text",
-                            "text": text
-                        }
-                    ]
-                }
-            }
-
-            await self.websocket.send(json.dumps(item))
+            # Create conversation item (prebuilt envelope around the encoded text)
+            item = self._text_item_prefix + self._json_encoder.encode(text) + self._text_item_suffix
+            await self.websocket.send(item, text=True)
 
             # Request response
-            response_request = {
-                "type": "response.create",
-                "response": {
-                    "modalities": ["text", "audio"]
-                }
-            }
-
-            await self.websocket.send(json.dumps(response_request))
+            await self.websocket.send(self._text_response_bytes, text=True)
 
             print(f"[OpenAI] Sent: {text}")
 
         except Exception as e:
             logger.error(f"Error sending message: {e}")
 
-    async def _handle_message(self, message: dict):
-        """Handle incoming WebSocket message"""
-        msg_type = message.get("type")
-
-        # Response started
-        if msg_type == "response.audio.delta":
-            if not self.is_playing_response:
-                self.is_playing_response = True
-                print("[OpenAI] Response started - blocking microphone input")
-            audio_b64 = message.get("delta")
-            if audio_b64:
-                audio_bytes = base64.b64decode(audio_b64)
-                self.audio_queue.put(audio_bytes)
-
-        # Response completed
-        elif msg_type == "response.done":
-            self.is_playing_response = False
-            print("[OpenAI] Response complete - microphone listening resumed")
-
-        # Input audio transcription (user's speech)
-        elif msg_type == "conversation.item.input_audio_transcription.completed":
-            transcript = message.get("transcript", "").lower()
-            logger.info(f"User said: {transcript}")
-            print(f"[User Transcript]: {transcript}")
-
-            # Check for dismissal phrases
-            if any(phrase in transcript for phrase in self.dismissal_phrases):
-                print(f"[OpenAI] Dismissal detected: '{transcript}'")
-                self.deactivate()
-                return
+    def _flush_audio_deltas(self):
+        """Move accumulated audio deltas into the playback ring in a single write
 
-            # Check if user is asking about vision
-            vision_keywords = ["what do you see", "what am i looking at", "describe this",
-                             "analyze this", "what is this", "look at", "can you see"]
-            if any(keyword in transcript for keyword in vision_keywords):
-                print(f"[Vision] Detected vision query, sending camera frame...")
-                await self._send_camera_frame()
-
-        # Transcript (text response from assistant)
-        elif msg_type == "response.text.delta":
-            text = message.get("delta", "")
-            if text:
-                print(f"[OpenAI Text]: {text}", end="", flush=True)
-
-        # Function call requested
-        elif msg_type == "response.function_call_arguments.done":
-            call_id = message.get("call_id")
-            function_name = message.get("name")
-            arguments_str = message.get("arguments")
-
-            print(f"[Function Call] {function_name}({arguments_str})")
-
-            if function_name == "web_search":
-                import json as json_module
-                args = json_module.loads(arguments_str)
-                query = args.get("query", "")
-
-                # Perform web search
-                result = await self._web_search(query)
-
-                # Send result back to model
-                await self.websocket.send(json.dumps({
-                    "type": "conversation.item.create",
-                    "item": {
-                        "type": "function_call_output",
-                        "call_id": call_id,
-                        "output": result
-                    }
-                }))
-
-                # Request response with the search result
-                await self.websocket.send(json.dumps({
-                    "type": "response.create"
-                }))
-
-            elif function_name == "get_system_status":
-                # Get system status
-                result = await self._get_system_status()
-
-                # Send result back to model
-                await self.websocket.send(json.dumps({
-                    "type": "conversation.item.create",
-                    "item": {
-                        "type": "function_call_output",
-                        "call_id": call_id,
-                        "output": result
-                    }
-                }))
-
-                # Request response with the status info
-                await self.websocket.send(json.dumps({
-                    "type": "response.create"
-                }))
-
-            elif function_name == "start_recording":
-                import json as json_module
-                args = json_module.loads(arguments_str)
-                duration = args.get("duration_seconds")
-
-                # Start recording
-                result = await self._start_recording(duration_seconds=duration)
-
-                # Send result back to model
-                await self.websocket.send(json.dumps({
-                    "type": "conversation.item.create",
-                    "item": {
-                        "type": "function_call_output",
-                        "call_id": call_id,
-                        "output": result
-                    }
-                }))
-
-                # Request response
-                await self.websocket.send(json.dumps({
-                    "type": "response.create"
-                }))
-
-            elif function_name == "stop_recording":
-                # Stop recording
-                result = await self._stop_recording()
-
-                # Send result back to model
-                await self.websocket.send(json.dumps({
-                    "type": "conversation.item.create",
-                    "item": {
-                        "type": "function_call_output",
-                        "call_id": call_id,
-                        "output": result
-                    }
-                }))
-
-                # Request response
-                await self.websocket.send(json.dumps({
-                    "type": "response.create"
-                }))
-
-            elif function_name == "get_recording_status":
-                # Get recording status
-                result = await self._get_recording_status()
-
-                # Send result back to model
-                await self.websocket.send(json.dumps({
-                    "type": "conversation.item.create",
-                    "item": {
-                        "type": "function_call_output",
-                        "call_id": call_id,
-                        "output": result
-                    }
-                }))
+        The server sends audio faster than real time, so a long response can
+        outgrow the ring; whatever does not fit stays in the accumulator and
+        _play_audio pulls it in as the ring drains.
+        """
+        self._delta_flush_pending = False
+        if not self._delta_accum:
+            return
 
-                # Request response
-                await self.websocket.send(json.dumps({
-                    "type": "response.create"
-                }))
+        written = self._ring.write(self._delta_accum)
+        if written:
+            del self._delta_accum[:written]  # Front deletion is O(1) amortized for bytearray
+            self._audio_ready.set()
+
+        overflow = len(self._delta_accum) - self._delta_backlog_max
+        if overflow > 0:
+            overflow += overflow & 1  # Keep whole 16-bit samples
+            del self._delta_accum[:overflow]
+            logger.warning(f"Playback backlog full, dropped {overflow} bytes of oldest audio")
+
+    async def _handle_message(self, message):
+        """Handle incoming WebSocket message (typed event from ServerEventDecoder)"""
+        handler = self._event_handlers.get(type(message))
+        if handler is not None:
+            # The hot audio-delta handler is a plain method (no coroutine per
+            # delta); the rest are coroutines
+            pending = handler(message)
+            if pending is not None:
+                await pending
+
+    def _on_audio_delta(self, message: AudioDelta):
+        """Response started / audio chunk"""
+        if not self.is_playing_response:
+            self.is_playing_response = True
+            print("[OpenAI] Response started - blocking microphone input")
+        audio_b64 = message.delta
+        if audio_b64:
+            # Coalesce deltas that arrive in the same loop iteration into one ring write
+            self._delta_accum += _b64decode(audio_b64)
+            if not self._delta_flush_pending:
+                self._delta_flush_pending = True
+                self.loop.call_soon(self._flush_audio_deltas)
+
+    async def _on_response_done(self, message: ResponseDone):
+        """Response completed"""
+        self._flush_audio_deltas()
+        self.is_playing_response = False
+        print("[OpenAI] Response complete - microphone listening resumed")
+
+    async def _on_transcription(self, message: TranscriptionCompleted):
+        """Input audio transcription (user's speech)"""
+        transcript = message.transcript
+        logger.info(f"User said: {transcript}")
+        print(f"[User Transcript]: {transcript}")
+
+        hits = self._keyword_matcher.find_tags(transcript)
+
+        # Check for dismissal phrases
+        if "dismiss" in hits:
+            print(f"[OpenAI] Dismissal detected: '{transcript}'")
+            self.deactivate()
+            return
 
-        # Error handling
-        elif msg_type == "error":
-            error = message.get("error", {})
-            # Suppress "input_audio_buffer_commit_empty" errors (expected when blocking mic)
-            if error.get("code") != "input_audio_buffer_commit_empty":
-                logger.error(f"OpenAI error: {error}")
-                print(f"[OpenAI Error]: {error}")
+        # Check if user is asking about vision
+        if "vision" in hits:
+            print(f"[Vision] Detected vision query, sending camera frame...")
+            await self._send_camera_frame()
 
-    def _init_audio_lazy(self):
-        """Initialize PyAudio on demand - both input and output with auto sample rate detection"""
-        if self.audio is not None:
-            return  # Already initialized
+    async def _on_text_delta(self, message: TextDelta):
+        """Transcript (text response from assistant)"""
+        text = message.delta
+        if text:
+            print(f"[OpenAI Text]: {text}", end="", flush=True)
+
+    async def _on_function_call(self, message: FunctionCallArgumentsDone):
+        """Function call requested"""
+        call_id = message.call_id
+        function_name = message.name
+        arguments_str = message.arguments
+
+        print(f"[Function Call] {function_name}({arguments_str})")
 
+        entry = self._tool_dispatch.get(function_name)
+        if entry is None:
+            logger.warning(f"Unknown function call: {function_name}")
+            return
+
+        handler, argnames = entry
+        try:
+            # Truncated or non-object arguments raise DecodeError (ValidationError
+            # is a subclass); the model gets an error result instead
+            args = self._tool_args_decoder.decode(arguments_str or "{}") if argnames else {}
+            result = await handler(**{k: args[k] for k in argnames if k in args})
+        except (msgspec.DecodeError, TypeError, ValueError) as e:
+            result = f"Invalid arguments for {function_name}: {e}"
+        await self._send_tool_result(call_id, result)
+
+    async def _on_error(self, message: ErrorEvent):
+        """Error handling"""
+        error = message.error
+        # Suppress "input_audio_buffer_commit_empty" errors (expected when blocking mic)
+        if error.get("code") != "input_audio_buffer_commit_empty":
+            logger.error(f"OpenAI error: {error}")
+            print(f"[OpenAI Error]: {error}")
+
+    async def _send_tool_result(self, call_id: str, result: str):
+        """
+        Return a tool result to the model and ask it to respond
+
+        Args:
+            call_id: Call ID from the function_call_arguments.done event
+            result: Tool output text
+        """
+        # Prebuilt envelope, only call_id/output are encoded. Both frames are
+        # ready before the first await so they go out back-to-back. They must
+        # stay two messages: send(iterable) would fragment them into a single
+        # message, which the server would reject as invalid JSON.
+        encode = self._json_encoder.encode
+        output_frame = self._FN_OUTPUT_TMPL % (encode(call_id), encode(result))
+        await self.websocket.send(output_frame, text=True)
+
+        # Request response with the function result
+        await self.websocket.send(self._RESPONSE_CREATE, text=True)
+
+    def _polyphase_taps(self, up: int, fir, needed: bool):
+        """
+        Polyphase branches for the Numba resampler
+
+        Args:
+            up: Upsampling factor
+            fir: Anti-aliasing FIR from _polyphase_params
+            needed: Whether this direction resamples at all
+
+        Returns:
+            Taps array, or None to use scipy's resample_poly
+        """
+        if not needed or not self._kernels:
+            return None
+        return self._kernels.polyphase_taps(up, fir)
+
+    @staticmethod
+    def _load_rate_cache() -> dict:
+        """Load the per-device sample rates found by earlier runs ({} if none)"""
         try:
-            import os
-            import numpy as np
-            from scipy import signal as scipy_signal
+            with open(_AUDIO_RATE_CACHE, 'rb') as f:
+                return msgspec.json.decode(f.read(), type=dict)
+        except (OSError, msgspec.DecodeError):
+            return {}
+
+    @staticmethod
+    def _save_rate_cache(rate_cache: dict):
+        """Persist probed sample rates for the next launch (best effort)"""
+        try:
+            os.makedirs(os.path.dirname(_AUDIO_RATE_CACHE), exist_ok=True)
+            tmp_path = _AUDIO_RATE_CACHE + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(msgspec.json.encode(rate_cache))
+            os.replace(tmp_path, _AUDIO_RATE_CACHE)
+        except OSError as e:
+            logger.warning(f"Could not save audio rate cache: {e}")
+
+    @staticmethod
+    def _polyphase_pad(taps, max_block: int):
+        """
+        Scratch buffer for the Numba resampler
+
+        Args:
+            taps: Branches from _polyphase_taps (or None)
+            max_block: Largest block in samples that will be resampled
+
+        Returns:
+            float32 array, or None when the Numba resampler is not used
+        """
+        if taps is None:
+            return None
+        return np.zeros(max_block + 2 * taps.shape[1], dtype=np.float32)
 
-            self.audio = pyaudio.PyAudio()
+    def _init_audio_lazy(self):
+        """Initialize audio streams on demand - both input and output with auto sample rate detection"""
+        if self.output_stream is not None:
+            return  # Already initialized
 
+        try:
             # Use PulseAudio environment variable to route to correct device
             os.environ['PULSE_SINK'] = 'alsa_output.usb-KTMicro_KT_USB_Audio_2021-06-07-0000-0000-0000--00.analog-stereo'
 
+            # Optional Numba kernels - imported here, not at module level, to keep UI startup cheap.
+            # Loaded before the streams open so the callbacks can use them from the first block
+            if self._kernels is None:
+                try:
+                    import audio_kernels
+                    audio_kernels.warm_up()
+                    self._kernels = audio_kernels
+                    print("[OpenAI Audio] Numba audio kernels loaded")
+                except ImportError:
+                    self._kernels = False  # NumPy/SciPy fallback
+
+            # Rates that worked last time for these devices are tried first
+            rate_cache = self._load_rate_cache()
+            in_key = f"in:{self.input_device_index}"
+            out_key = f"out:{self.output_device_index}"
+
             # Input stream - auto-detect supported sample rate and resample to 24kHz
             # Try 24kHz first, then fallback to higher rates with resampling
             self.input_native_rate = 24000
             self.needs_resampling = False
 
-            for test_rate in [24000, 48000, 44100]:
+            input_rates = _cached_first([24000, 48000, 44100], rate_cache.get(in_key))
+            for test_rate in input_rates:
                 try:
-                    self.input_stream = self.audio.open(
-                        format=pyaudio.paInt16,
+                    # Resampler state must be ready before the callback starts firing
+                    self.needs_resampling = (test_rate != 24000)
+                    self._in_up, self._in_down, self._in_fir = _polyphase_params(test_rate, 24000)
+                    self._in_taps = self._polyphase_taps(self._in_up, self._in_fir, self.needs_resampling)
+                    self._in_pad = self._polyphase_pad(self._in_taps, int(test_rate * 0.02))
+                    self.input_stream = sd.RawInputStream(
+                        samplerate=test_rate,
                         channels=1,
-                        rate=test_rate,
-                        input=True,
-                        input_device_index=self.input_device_index,
-                        frames_per_buffer=int(test_rate * 0.02),  # 20ms at native rate
+                        dtype='int16',
+                        device=self.input_device_index,
+                        blocksize=int(test_rate * 0.02),  # 20ms at native rate
+                        callback=self._input_callback,
                     )
+                    self.input_stream.start()
                     self.input_native_rate = test_rate
-                    self.needs_resampling = (test_rate != 24000)
                     print(f"[OpenAI Audio] Input: {test_rate}Hz (resample={self.needs_resampling})")
                     break
                 except Exception as e:
-                    if test_rate == 44100:  # Last attempt
+                    if test_rate == input_rates[-1]:  # Last attempt
                         raise
                     continue
 
@@ -961,139 +1377,235 @@ class OpenAIRealtimeAssistant:
             self.output_native_rate = 44100
             self.needs_output_resampling = True
 
-            for test_rate in [44100, 48000, 24000]:
+            self._out_ring.reset()  # No callback running yet - drop stale audio
+
+            output_rates = _cached_first([44100, 48000, 24000], rate_cache.get(out_key))
+            for test_rate in output_rates:
                 try:
-                    self.output_stream = self.audio.open(
-                        format=pyaudio.paInt16,
+                    self.output_stream = sd.RawOutputStream(
+                        samplerate=test_rate,
                         channels=1,
-                        rate=test_rate,
-                        output=True,
-                        output_device_index=self.output_device_index,
-                        frames_per_buffer=int(test_rate * 0.05),  # 50ms buffer
+                        dtype='int16',
+                        device=self.output_device_index,
+                        blocksize=2048,
+                        latency='high',
+                        callback=self._output_callback,
                     )
+                    self.output_stream.start()
                     self.output_native_rate = test_rate
                     self.needs_output_resampling = (test_rate != 24000)
                     print(f"[OpenAI Audio] Output: {test_rate}Hz (resample={self.needs_output_resampling})")
                     break
                 except Exception as e:
-                    if test_rate == 44100:  # Last attempt
+                    if test_rate == output_rates[-1]:  # Last attempt
                         raise
                     continue
 
+            # Polyphase resampler parameters for the chosen output rate
+            self._out_up, self._out_down, self._out_fir = _polyphase_params(24000, self.output_native_rate)
+            self._out_taps = self._polyphase_taps(self._out_up, self._out_fir, self.needs_output_resampling)
+            self._out_pad = self._polyphase_pad(self._out_taps, len(self._play_buf) // 2)
+
+            if (rate_cache.get(in_key), rate_cache.get(out_key)) != (self.input_native_rate, self.output_native_rate):
+                rate_cache[in_key] = self.input_native_rate
+                rate_cache[out_key] = self.output_native_rate
+                self._save_rate_cache(rate_cache)
+
             print(f"[OpenAI Audio] Streams initialized")
             logger.info("Audio streams initialized on-demand")
 
         except Exception as e:
             logger.error(f"Error initializing audio: {e}")
-            import traceback
             traceback.print_exc()
-            self.audio = None
             self.input_stream = None
             self.output_stream = None
 
     async def _send_audio(self):
-        """Send microphone audio to OpenAI - only when activated"""
-        import concurrent.futures
-        import numpy as np
-        from scipy import signal as scipy_signal
-
-        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        """Send buffered microphone audio to OpenAI in batches - only when activated"""
+        chunk_mv = memoryview(bytearray(self._mic_ring.capacity))
+        dropped = 0
+        last_report = time.monotonic()
+        last_flush = last_report
 
         while self.is_running:
             try:
                 # Only send audio if activated by wake word
                 if not self.send_audio_enabled:
+                    if self._mic_ring.available():
+                        await self._flush_mic_audio(chunk_mv)  # Don't strand trailing audio
                     await asyncio.sleep(0.1)  # Wait for activation
                     continue
 
-                if self.input_stream:
-                    # Calculate chunk size at native rate (20ms)
-                    native_chunk = int(self.input_native_rate * 0.02)
-
-                    # Read audio in thread pool to avoid blocking
-                    loop = asyncio.get_event_loop()
-                    audio_data = await loop.run_in_executor(
-                        executor,
-                        lambda: self.input_stream.read(native_chunk, exception_on_overflow=False)
-                    )
+                # Bound speech-to-VAD latency: drop the oldest audio beyond ~500ms
+                excess = self._mic_ring.available() - self._mic_backlog_bytes
+                if excess > 0:
+                    excess += excess & 1  # Stay sample-aligned
+                    dropped += self._mic_ring.discard(excess)
+
+                now = time.monotonic()
+                if now - last_report >= 1.0:
+                    if dropped:
+                        logger.warning(f"Mic backlog: dropped {dropped} bytes in the last second")
+                        dropped = 0
+                    last_report = now
+
+                # Send one frame per batch (default 100ms) instead of one per 20ms read
+                batch_seconds = self._mic_batch_ms / 1000
+                available = self._mic_ring.available()
+                if available < self._mic_batch_bytes and not (
+                        available and now - last_flush >= batch_seconds):
+                    # Sleep until the input callback signals a full batch (or the batch period ends)
+                    self._mic_ready.clear()
+                    try:
+                        await asyncio.wait_for(self._mic_ready.wait(), timeout=batch_seconds)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
 
-                    # If assistant is speaking, discard mic input (don't send it)
-                    # This prevents the assistant from hearing itself
-                    if self.is_playing_response:
-                        continue  # Discard the audio, don't send to OpenAI
-
-                    # Resample if needed
-                    if self.needs_resampling:
-                        # Convert bytes to numpy array
-                        audio_np = np.frombuffer(audio_data, dtype=np.int16)
-
-                        # Resample to 24kHz
-                        num_samples_24k = int(len(audio_np) * 24000 / self.input_native_rate)
-                        audio_resampled = scipy_signal.resample(audio_np, num_samples_24k)
-
-                        # Convert back to int16 bytes
-                        audio_data = audio_resampled.astype(np.int16).tobytes()
-
-                    # Send to OpenAI as base64
-                    audio_b64 = base64.b64encode(audio_data).decode('utf-8')
-                    await self.websocket.send(json.dumps({
-                        "type": "input_audio_buffer.append",
-                        "audio": audio_b64
-                    }))
-                else:
-                    await asyncio.sleep(0.02)  # Wait for audio init
+                await self._flush_mic_audio(chunk_mv)
+                last_flush = now
             except Exception as e:
                 logger.error(f"Error sending audio: {e}")
                 await asyncio.sleep(0.1)
 
-    async def _play_audio(self):
-        """Play audio from queue - non-blocking with executor"""
-        import concurrent.futures
-        import numpy as np
-        from scipy import signal as scipy_signal
+    async def _flush_mic_audio(self, chunk_mv):
+        """Send up to one batch of buffered mic audio as a single input_audio_buffer.append"""
+        n = self._mic_ring.read_into(chunk_mv, min(self._mic_batch_bytes, len(chunk_mv)))
+        if not n or not self.websocket:
+            return
+
+        # Send to OpenAI as base64 (bytes sent as a text frame, no str round-trip)
+        frame = b''.join((self._AUDIO_PREFIX, _b64encode(chunk_mv[:n]), self._AUDIO_SUFFIX))
+        await self.websocket.send(frame, text=True)
 
-        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    async def _play_audio(self):
+        """Move audio from the 24kHz ring to the device-rate output ring read by the PortAudio callback"""
+        chunk_mv = self._play_mv
+        max_out_bytes = self._out_scratch.nbytes  # Worst case after resampling one chunk
 
         while self.is_running:
             try:
-                # Get audio from queue (non-blocking)
-                try:
-                    audio_data = self.audio_queue.get_nowait()
-                    print(f"[Audio Play] Got {len(audio_data)} bytes from queue, output_stream={self.output_stream is not None}")
+                # Sleep until the producer signals new audio
+                if not self._ring.available() and self._delta_accum:
+                    self._flush_audio_deltas()
+                if not self._ring.available():
+                    self._playback_drained.set()
+                    self._audio_ready.clear()
+                    await self._audio_ready.wait()
+                    continue
+
+                # Backpressure: let the output callback drain before converting more
+                if self.output_stream and self._out_ring.free() < max_out_bytes:
+                    await asyncio.sleep(0.02)
+                    continue
+
+                n = self._ring.read_into(chunk_mv, len(chunk_mv))
+                if self._delta_accum and not self._delta_flush_pending:
+                    self._flush_audio_deltas()  # Refill from overflow now that there is room
+                if n:
+                    audio_data = chunk_mv[:n]
+                    if self._debug_audio:
+                        logger.debug(f"[Audio Play] Got {n} bytes from ring, output_stream={self.output_stream is not None}")
 
                     if self.output_stream:
-                        # Convert to numpy for processing
-                        audio_np = np.frombuffer(audio_data, dtype=np.int16)
-
-                        # Apply volume control
-                        if self.output_volume != 1.0:
-                            audio_np = (audio_np * self.output_volume).astype(np.int16)
-
-                        # Resample if needed (OpenAI sends 24kHz, device might need different rate)
-                        if self.needs_output_resampling:
-                            num_samples = int(len(audio_np) * self.output_native_rate / 24000)
-                            audio_np = scipy_signal.resample(audio_np, num_samples).astype(np.int16)
-
-                        audio_data = audio_np.tobytes()
-
-                        # Run blocking write in executor to avoid blocking event loop
-                        loop = asyncio.get_event_loop()
-                        print(f"[Audio Play] Writing {len(audio_data)} bytes to speaker...")
-                        await loop.run_in_executor(
-                            executor,
-                            self.output_stream.write,
-                            audio_data
-                        )
-                        print(f"[Audio Play] Write complete")
-                except queue.Empty:
-                    await asyncio.sleep(0.01)
+                        # Unity volume at the native rate: copy straight from the playback buffer
+                        if self._volume_q15 != 32768 or self.needs_output_resampling:
+                            # View the playback buffer as int16 (writable, no copy)
+                            audio_np = np.frombuffer(audio_data, dtype=np.int16)
+
+                            # Apply volume control in place (Q15 fixed-point; gain <= 1 cannot overflow)
+                            if self._volume_q15 != 32768 and self._kernels:
+                                self._kernels.scale_int16(audio_np, self._volume_q15, audio_np)
+                            elif self._volume_q15 != 32768:
+                                acc = self._vol_scratch[:len(audio_np)]
+                                np.multiply(audio_np, np.int32(self._volume_q15), out=acc)
+                                np.right_shift(acc, 15, out=acc)
+                                np.copyto(audio_np, acc, casting='unsafe')
+
+                            # Resample if needed (OpenAI sends 24kHz, device might need different rate)
+                            if self.needs_output_resampling and self._out_taps is not None:
+                                n = self._kernels.resample_int16(
+                                    audio_np, self._out_taps, self._out_up, self._out_down,
+                                    (len(self._out_fir) - 1) // 2, self._out_pad, self._out_scratch
+                                )
+                                audio_np = self._out_scratch[:n]
+                            elif self.needs_output_resampling:
+                                resampled = scipy_signal.resample_poly(
+                                    audio_np, self._out_up, self._out_down, window=self._out_fir
+                                )
+                                np.clip(resampled, -32768, 32767, out=resampled)
+                                audio_np = self._out_scratch[:len(resampled)]
+                                np.copyto(audio_np, resampled, casting='unsafe')
+
+                            audio_data = audio_np
+
+                        # Hand off to the output callback (no blocking write on any thread)
+                        self._out_ring.write(audio_data)
             except Exception as e:
-                # Suppress "Stream closed" errors (expected when deactivating)
-                if "Stream closed" not in str(e) and "Unanticipated host error" not in str(e):
-                    logger.error(f"Error playing audio: {e}")
-                    print(f"[OpenAI Audio Error]: {e}")
+                logger.error(f"Error playing audio: {e}")
+                print(f"[OpenAI Audio Error]: {e}")
+
+    @property
+    def _mic_batch_bytes(self) -> int:
+        """Bytes of 24kHz PCM16 per mic batch"""
+        return int(24000 * self._mic_batch_ms / 1000) * 2
+
+    @property
+    def output_volume(self) -> float:
+        """Output volume multiplier (0.0-1.0)"""
+        return self._output_volume
+
+    @output_volume.setter
+    def output_volume(self, value: float):
+        self._output_volume = max(0.0, min(1.0, value))
+        # Cached Q15 multiplier used by _play_audio
+        self._volume_q15 = int(self._output_volume * 32768)
+
+    @property
+    def is_playing_response(self) -> bool:
+        """Whether a response is being spoken (the mic stream is stopped meanwhile)"""
+        return self._playing_response
+
+    @is_playing_response.setter
+    def is_playing_response(self, playing: bool):
+        if playing == self._playing_response:
+            return
+        self._playing_response = playing
+        self._pause_mic(playing)
+
+    def _pause_mic(self, paused: bool):
+        """
+        Stop or restart the mic stream so PortAudio does no capture work while
+        the assistant is speaking
+
+        abort()/start() block on the PortAudio callback thread, so they run on
+        the audio executor (in order with stream teardown), not on the loop.
+        The input callback already drops blocks while _playing_response is set.
+
+        Args:
+            paused: True to stop capturing, False to resume
+        """
+        stream = self.input_stream
+        if stream is None:
+            return
+        if self._audio_executor:
+            self._audio_executor.submit(self._set_mic_paused, stream, paused)
+        else:
+            self._set_mic_paused(stream, paused)
+
+    def _set_mic_paused(self, stream, paused: bool):
+        """Abort or restart one input stream (runs on the audio executor)"""
+        if stream is not self.input_stream:
+            return  # Torn down (or replaced) since the request was queued
+        try:
+            if paused:
+                stream.abort()  # Drop buffered input immediately, nothing to drain
+            elif not stream.active:
+                stream.start()
+        except Exception as e:
+            logger.warning(f"Could not {'pause' if paused else 'resume'} microphone: {e}")
 
     @property
     def is_speaking(self):
         """Check if assistant is currently speaking"""
-        return not self.audio_queue.empty()
+        return bool(self._delta_accum) or self._ring.available() > 0 or self._out_ring.available() > 0
@@ -2,31 +2,55 @@
 
 import grpc
 import logging
-from typing import Optional
+import queue
+import threading
+from typing import Callable, Optional
 
 import sys
 from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent.parent / "libs"))
+# main.py already puts libs on the path; only add it when imported standalone
+_LIBS_DIR = str(Path(__file__).parent.parent.parent / "libs")
+if _LIBS_DIR not in sys.path:
+    sys.path.append(_LIBS_DIR)
 from messages import helmet_pb2, helmet_pb2_grpc
+from utils.shared_frames import SHM_PREFIX, SharedFramePool
 
 logger = logging.getLogger(__name__)
 
 class PerceptionClient:
     """Client for perception service communication"""
 
-    def __init__(self, server_address: str):
+    def __init__(self, server_address: str, shared_memory: bool = False):
+        """
+        Args:
+            server_address: host:port of the perception service
+            shared_memory: Pass frame pixels through shared memory instead of
+                inside the request (service must run on the same host)
+        """
         self.server_address = server_address
         self.channel = None
         self.stub = None
+        self._frame_pool = SharedFramePool() if shared_memory else None
+        self._frame_pool_lock = threading.Lock()
+        # Persistent InferStream call (opened on first submit_frame)
+        self._stream_call = None
+        self._stream_queue = None
+        self._stream_lock = threading.Lock()
         self._connect()
 
     def _connect(self):
         """Connect to perception service"""
         try:
-            # Create channel with increased message size for high-res frames
+            # Create channel with increased message size for high-res frames.
+            # HTTP/2 keepalive pings keep the connection warm between bursts so a
+            # request never pays a reconnect, and detect a dead service in ~12s
             options = [
                 ('grpc.max_send_message_length', 50 * 1024 * 1024),
                 ('grpc.max_receive_message_length', 50 * 1024 * 1024),
+                ('grpc.keepalive_time_ms', 10000),
+                ('grpc.keepalive_timeout_ms', 2000),
+                ('grpc.keepalive_permit_without_calls', 1),
+                ('grpc.http2.max_pings_without_data', 0),
             ]
             self.channel = grpc.insecure_channel(self.server_address, options=options)
             self.stub = helmet_pb2_grpc.PerceptionServiceStub(self.channel)
@@ -42,8 +66,11 @@ class PerceptionClient:
             if not self.stub:
                 return None
 
-            response = self.stub.Infer(frame_meta, timeout=2)
-            return response
+            request = self._outgoing(frame_meta)
+            try:
+                return self.stub.Infer(request, timeout=2)
+            finally:
+                self._release(request)
 
         except grpc.RpcError as e:
             if e.code() != grpc.StatusCode.DEADLINE_EXCEEDED:
@@ -53,6 +80,194 @@ class PerceptionClient:
             logger.error(f"Unexpected error during inference: {e}")
             return None
 
+    def infer_async(self, frame_meta: helmet_pb2.FrameMeta,
+                    on_result: Callable[[Optional[helmet_pb2.DetectionResult]], None]) -> bool:
+        """
+        Start inference on a frame without blocking the caller
+
+        Several requests can be in flight at once on the shared channel.
+
+        Args:
+            frame_meta: Frame to run inference on
+            on_result: Called from a gRPC thread with the result (None on error)
+
+        Returns:
+            True if the request was sent
+        """
+        if not self.stub:
+            return False
+
+        request = self._outgoing(frame_meta)
+
+        def done(future):
+            self._release(request)
+            try:
+                on_result(future.result())
+            except grpc.RpcError as e:
+                if e.code() != grpc.StatusCode.DEADLINE_EXCEEDED:
+                    logger.error(f"Perception service error: {e}")
+                on_result(None)
+            except Exception as e:
+                logger.error(f"Unexpected error during inference: {e}")
+                on_result(None)
+
+        try:
+            self.stub.Infer.future(request, timeout=2).add_done_callback(done)
+            return True
+        except Exception as e:
+            self._release(request)
+            logger.error(f"Failed to start inference: {e}")
+            return False
+
+    def submit_frame(self, frame_meta: helmet_pb2.FrameMeta,
+                     on_result: Callable[[helmet_pb2.DetectionResult], None]) -> bool:
+        """
+        Queue a frame on the persistent InferStream RPC
+
+        One bidirectional stream carries every frame, so there is no per-frame
+        RPC setup. Results arrive in order on a receiver thread, each tagged
+        with its frame_id. If the service is still busy, the newest frame
+        replaces the one waiting to be sent.
+
+        Args:
+            frame_meta: Frame to run inference on
+            on_result: Called from the receiver thread for every result
+
+        Returns:
+            True if the frame was queued
+        """
+        if not self.stub:
+            return False
+
+        with self._stream_lock:
+            if self._stream_call is None:
+                try:
+                    self._open_stream(on_result)
+                except Exception as e:
+                    logger.error(f"Failed to open perception stream: {e}")
+                    return False
+            frames = self._stream_queue
+
+        frame_meta = self._outgoing(frame_meta)
+        try:
+            frames.put_nowait(frame_meta)
+        except queue.Full:
+            # Drop the stale frame still waiting to be sent, keep the newest
+            try:
+                stale = frames.get_nowait()
+                if stale is not None:
+                    self._release(stale)
+            except queue.Empty:
+                pass
+            try:
+                frames.put_nowait(frame_meta)
+            except queue.Full:
+                self._release(frame_meta)
+                return False
+        return True
+
+    def _outgoing(self, frame_meta: helmet_pb2.FrameMeta) -> helmet_pb2.FrameMeta:
+        """
+        Swap the pixel payload for a shared memory reference when enabled
+
+        The slot stays held until _release is called for the request (when its
+        result arrives); with every slot in flight the pixels are sent inline.
+        """
+        if self._frame_pool is None or not frame_meta.data:
+            return frame_meta
+
+        with self._frame_pool_lock:
+            ref = self._frame_pool.put(frame_meta.data, frame_meta.frame_id)
+        if ref is None:
+            return frame_meta
+        request = helmet_pb2.FrameMeta(
+            frame_id=frame_meta.frame_id,
+            width=frame_meta.width,
+            height=frame_meta.height,
+            format=SHM_PREFIX + frame_meta.format,
+            data=ref,
+        )
+        request.timestamp.CopyFrom(frame_meta.timestamp)
+        return request
+
+    def _release(self, request: helmet_pb2.FrameMeta):
+        """Free the shared memory slot a request from _outgoing was using"""
+        if self._frame_pool is not None and request.format.startswith(SHM_PREFIX):
+            self._release_id(request.frame_id)
+
+    def _release_id(self, frame_id: int):
+        """Free the shared memory slot held for frame_id, if any"""
+        if self._frame_pool is not None:
+            with self._frame_pool_lock:
+                self._frame_pool.release(frame_id)
+
+    def _open_stream(self, on_result):
+        """Start the InferStream call and its receiver thread (caller holds _stream_lock)"""
+        frames = queue.Queue(maxsize=1)
+
+        def requests():
+            while True:
+                try:
+                    frame_meta = frames.get(timeout=1)
+                except queue.Empty:
+                    # Backstop for a sentinel that was displaced by a late
+                    # submit_frame: stop consuming once the call has ended
+                    if call.done():
+                        return
+                    continue
+                if frame_meta is None:
+                    return
+                yield frame_meta
+
+        call = self.stub.InferStream(requests())
+        self._stream_queue = frames
+        self._stream_call = call
+
+        def receive():
+            try:
+                for result in call:
+                    self._release_id(result.frame_id)  # Service is done with its pixels
+                    on_result(result)
+            except grpc.RpcError as e:
+                if e.code() != grpc.StatusCode.CANCELLED:
+                    logger.error(f"Perception stream error: {e}")
+            except Exception as e:
+                logger.error(f"Unexpected error in perception stream: {e}")
+            finally:
+                with self._stream_lock:
+                    if self._stream_call is call:
+                        # Next submit_frame reopens the stream
+                        self._stream_call = None
+                        self._stream_queue = None
+                # Release gRPC's request-consumer thread blocked in requests()
+                self._end_requests(frames)
+
+        threading.Thread(target=receive, daemon=True, name="perception-stream").start()
+        logger.info("Perception inference stream opened")
+
+    def _close_stream(self):
+        """End the InferStream call if one is open"""
+        with self._stream_lock:
+            call, frames = self._stream_call, self._stream_queue
+            self._stream_call = None
+            self._stream_queue = None
+        if call is not None:
+            self._end_requests(frames)  # Half-close the request side
+            call.cancel()
+
+    def _end_requests(self, frames: queue.Queue):
+        """Replace any unsent frame with the end-of-stream sentinel"""
+        try:
+            stale = frames.get_nowait()
+            if stale is not None:
+                self._release(stale)
+        except queue.Empty:
+            pass
+        try:
+            frames.put_nowait(None)
+        except queue.Full:
+            pass  # A racing submit_frame refilled it; requests() stops once the call is done
+
     def set_roi(self, x: float, y: float, width: float, height: float, enabled: bool = True) -> bool:
         """Set region of interest for detection"""
         try:
@@ -75,6 +290,9 @@ class PerceptionClient:
 
     def disconnect(self):
         """Disconnect from perception service"""
+        self._close_stream()
+        if self._frame_pool is not None:
+            self._frame_pool.close()
         if self.channel:
             self.channel.close()
             logger.info("Disconnected from perception service")
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""Single-pass multi-phrase matching for voice transcripts"""
+
+import re
+import logging
+from typing import Dict, Iterable, Set, Union
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class PhraseMatcher:
+    """Finds any of a fixed set of tagged phrases in a text in one pass
+
+    Uses a pyahocorasick automaton when available, otherwise a single
+    compiled regex alternation (longest phrases first).
+    """
+
+    def __init__(self, phrases: Union[Iterable[str], Dict[str, str]], ignore_case: bool = False):
+        """
+        Args:
+            phrases: Phrases to look for (matched as plain substrings), either
+                an iterable (each phrase is its own tag) or a phrase -> tag dict
+            ignore_case: Match regardless of case, so callers can pass raw
+                text instead of lowercasing it first
+        """
+        if not isinstance(phrases, dict):
+            phrases = {phrase: phrase for phrase in phrases}
+        if ignore_case:
+            phrases = {phrase.lower(): tag for phrase, tag in phrases.items()}
+        self._tags = dict(phrases)
+        self.phrases = list(self._tags)
+        self.ignore_case = ignore_case
+
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for phrase, tag in self._tags.items():
+                self._automaton.add_word(phrase, tag)
+            self._automaton.make_automaton()
+            self._regex = None
+        else:
+            self._automaton = None
+            ordered = sorted(self.phrases, key=len, reverse=True)
+            # One group per phrase so the tag is found by group index, whatever
+            # the case of the matched text
+            self._group_tags = [self._tags[p] for p in ordered]
+            flags = re.IGNORECASE if ignore_case else 0
+            self._regex = re.compile("|".join(f"({re.escape(p)})" for p in ordered), flags)
+
+    def find_tags(self, text: str) -> Set[str]:
+        """
+        Collect the tags of all phrases found in text
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set of matched tags (empty if nothing matched)
+        """
+        if not self.phrases:
+            return set()
+
+        if self._automaton is not None:
+            if self.ignore_case:
+                # The automaton is case-sensitive; the regex path folds case itself
+                text = text.lower()
+            return {tag for _, tag in self._automaton.iter(text)}
+
+        return {self._group_tags[m.lastindex - 1] for m in self._regex.finditer(text)}
@@ -1,6 +1,7 @@
 """Power management system for helmet displays"""
 
 import logging
+import time
 from enum import Enum
 from typing import Callable, Optional
 
@@ -14,13 +15,56 @@ class PowerProfile(Enum):
     SAVER = "saver"             # 10 FPS, minimal features
 
 
+# Spoken names accepted by set_profile_by_name
+_NAME_TO_PROFILE = {
+    **{n: PowerProfile.PERFORMANCE for n in ('performance', 'perf', 'high', 'max')},
+    **{n: PowerProfile.BALANCED for n in ('balanced', 'balance', 'medium', 'normal')},
+    **{n: PowerProfile.SAVER for n in ('saver', 'save', 'low', 'eco', 'economy')},
+}
+
+
 class PowerManager:
     """Manage power profiles and frame rates"""
 
-    def __init__(self, initial_profile: PowerProfile = PowerProfile.BALANCED):
+    # Least to most restrictive, for comparing how far auto_adjust has stepped down
+    _SEVERITY = {
+        PowerProfile.PERFORMANCE: 0,
+        PowerProfile.BALANCED: 1,
+        PowerProfile.SAVER: 2,
+    }
+
+    def __init__(self, initial_profile: PowerProfile = PowerProfile.BALANCED,
+                 battery_hysteresis: float = 5, temp_hysteresis: float = 5,
+                 min_dwell_s: float = 30.0):
+        """
+        Args:
+            initial_profile: Profile to start in
+            battery_hysteresis: Extra battery % required above an entry
+                threshold before auto_adjust steps back out of that profile
+            temp_hysteresis: Degrees C the temperature must fall below an entry
+                threshold before auto_adjust steps back out of that profile
+            min_dwell_s: Minimum time after a switch before auto_adjust steps back
+                to a less restrictive profile
+        """
         self.current_profile = initial_profile
         self.profile_change_callback = None
 
+        # auto_adjust thresholds as (battery below %, temperature above °C).
+        # A profile is entered when either limit is crossed, but only left once
+        # both have recovered past the wider exit band, so a reading hovering
+        # on a boundary doesn't flip the profile every tick.
+        self._enter_thresholds = {
+            PowerProfile.SAVER: (15, 75),
+            PowerProfile.BALANCED: (30, 65),
+        }
+        self._exit_thresholds = {
+            profile: (battery + battery_hysteresis, temp - temp_hysteresis)
+            for profile, (battery, temp) in self._enter_thresholds.items()
+        }
+        self.min_dwell_s = min_dwell_s
+        self._last_switch_ts = None  # monotonic time of the last automatic switch
+        self._auto_restore_profile = None  # Profile in use before auto_adjust stepped down
+
         # Profile configurations
         self.profile_configs = {
             PowerProfile.PERFORMANCE: {
@@ -58,6 +102,8 @@ class PowerManager:
             }
         }
 
+        self._apply_profile_cache()
+
         logger.info(f"Power manager initialized with profile: {self.current_profile.value}")
 
     def set_profile(self, profile: PowerProfile):
@@ -74,7 +120,12 @@ class PowerManager:
         old_profile = self.current_profile
         self.current_profile = profile
 
-        config = self.profile_configs[profile]
+        # An explicit choice overrides whatever auto_adjust was doing
+        self._auto_restore_profile = None
+        self._last_switch_ts = None
+
+        self._apply_profile_cache()
+        config = self._active_config
         logger.info(f"Power profile changed: {old_profile.value} -> {profile.value}")
         logger.info(f"  FPS: {config['fps']}, Features: {config['features']}")
 
@@ -82,17 +133,23 @@ class PowerManager:
         if self.profile_change_callback:
             self.profile_change_callback(profile, config)
 
+    def _apply_profile_cache(self):
+        """Resolve the current profile's settings once, for the per-frame getters"""
+        self._active_config = self.profile_configs[self.current_profile]
+        self._active_interval_ms = self._active_config['frame_interval_ms']
+        self._active_fps = self._active_config['fps']
+
     def get_current_config(self) -> dict:
         """Get configuration for current profile"""
-        return self.profile_configs[self.current_profile]
+        return self._active_config
 
     def get_frame_interval_ms(self) -> int:
         """Get frame update interval in milliseconds"""
-        return self.profile_configs[self.current_profile]['frame_interval_ms']
+        return self._active_interval_ms
 
     def get_target_fps(self) -> int:
         """Get target FPS for current profile"""
-        return self.profile_configs[self.current_profile]['fps']
+        return self._active_fps
 
     def register_callback(self, callback: Callable[[PowerProfile, dict], None]):
         """
@@ -103,44 +160,85 @@ class PowerManager:
         """
         self.profile_change_callback = callback
 
+    def _desired_profile(self, battery_level: float, temperature: float) -> PowerProfile:
+        """Profile the readings call for, applying the exit band when stepping back up"""
+        current = self.current_profile
+        for profile in (PowerProfile.SAVER, PowerProfile.BALANCED):
+            battery, temp = self._enter_thresholds[profile]
+            if battery_level < battery or temperature > temp:
+                entered = profile
+                break
+        else:
+            entered = PowerProfile.PERFORMANCE
+
+        if self._SEVERITY[entered] >= self._SEVERITY[current]:
+            return entered
+
+        # De-escalating: stay in each restricted profile until its exit band is cleared
+        for profile in (PowerProfile.SAVER, PowerProfile.BALANCED):
+            if self._SEVERITY[profile] > self._SEVERITY[current]:
+                continue
+            battery, temp = self._exit_thresholds[profile]
+            if battery_level < battery or temperature > temp:
+                return profile
+        return PowerProfile.PERFORMANCE
+
     def auto_adjust(self, battery_level: float, temperature: float):
         """
         Automatically adjust power profile based on battery and temperature
 
+        Steps down to BALANCED/SAVER when a threshold is crossed, and back up
+        (never past the profile in use before it stepped down) once the
+        readings clear the hysteresis band. Stepping back up is held off until
+        min_dwell_s after the last switch; stepping down is never delayed.
+
         Args:
             battery_level: Battery percentage (0-100)
             temperature: CPU temperature in Celsius
+
+        Returns:
+            True if the profile was changed
         """
-        # Auto-switch to SAVER mode if battery critical or overheating
-        if battery_level < 15 or temperature > 75:
-            if self.current_profile != PowerProfile.SAVER:
-                logger.warning(f"Auto-switching to SAVER mode (battery: {battery_level}%, temp: {temperature}°C)")
-                self.set_profile(PowerProfile.SAVER)
-                return True
-
-        # Auto-switch to BALANCED if battery moderate or temp elevated
-        elif battery_level < 30 or temperature > 65:
-            if self.current_profile == PowerProfile.PERFORMANCE:
-                logger.warning(f"Auto-switching to BALANCED mode (battery: {battery_level}%, temp: {temperature}°C)")
-                self.set_profile(PowerProfile.BALANCED)
-                return True
-
-        return False
+        current = self.current_profile
+        desired = self._desired_profile(battery_level, temperature)
+        restore = self._auto_restore_profile
+
+        if self._SEVERITY[desired] < self._SEVERITY[current]:
+            if restore is None:
+                return False  # Restricted profile was chosen manually; leave it
+            if self._SEVERITY[desired] < self._SEVERITY[restore]:
+                desired = restore
+        if desired == current:
+            return False
+
+        now = time.monotonic()
+        escalating = self._SEVERITY[desired] > self._SEVERITY[current]
+        # Dwell only stops flapping on recovery; overheating or a draining
+        # battery switches down immediately
+        if (not escalating and self._last_switch_ts is not None
+                and now - self._last_switch_ts < self.min_dwell_s):
+            return False
+
+        if escalating:
+            logger.warning(f"Auto-switching to {desired.name} mode (battery: {battery_level}%, temp: {temperature}°C)")
+            if restore is None:
+                restore = current
+        else:
+            logger.info(f"Auto-restoring {desired.name} mode (battery: {battery_level}%, temp: {temperature}°C)")
+
+        self.set_profile(desired)
+        self._auto_restore_profile = None if desired == restore else restore
+        self._last_switch_ts = now
+        return True
 
     def set_profile_by_name(self, name: str):
         """Set profile by string name (for voice commands)"""
-        name_lower = name.lower().strip()
-
-        if name_lower in ['performance', 'perf', 'high', 'max']:
-            self.set_profile(PowerProfile.PERFORMANCE)
-        elif name_lower in ['balanced', 'balance', 'medium', 'normal']:
-            self.set_profile(PowerProfile.BALANCED)
-        elif name_lower in ['saver', 'save', 'low', 'eco', 'economy']:
-            self.set_profile(PowerProfile.SAVER)
-        else:
+        profile = _NAME_TO_PROFILE.get(name.lower().strip())
+        if profile is None:
             logger.warning(f"Unknown power profile: {name}")
             return False
 
+        self.set_profile(profile)
         return True
 
     def get_status_string(self) -> str:
@@ -32,10 +32,8 @@ ApplicationWindow {
             cache: false
             asynchronous: false  // Synchronous for lower latency
             smooth: false        // Disable smoothing for performance
-
-            function updateFrame(framePath) {
-                source = framePath
-            }
+            // Refreshes only when the camera publishes a new frame
+            source: visorApp.frameId > 0 ? "image://video/" + visorApp.frameId : ""
         }
     }
 
@@ -200,10 +198,6 @@ ApplicationWindow {
     Connections {
         target: visorApp
 
-        function onFrameUpdated(framePath) {
-            fullscreenVideo.updateFrame(framePath)
-        }
-
         function onDetectionsUpdated(detections) {
             // Always update detection overlay (it will handle visibility internally)
             detectionOverlay.updateDetections(detections)
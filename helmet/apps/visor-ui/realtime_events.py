@@ -0,0 +1,71 @@
+"""Typed server events from the OpenAI Realtime API, decoded with msgspec"""
+
+from typing import Union
+
+import msgspec
+
+
+class AudioDelta(msgspec.Struct, tag_field="type", tag="response.audio.delta"):
+    delta: str = ""
+
+
+class ResponseDone(msgspec.Struct, tag_field="type", tag="response.done"):
+    pass
+
+
+class TranscriptionCompleted(msgspec.Struct, tag_field="type",
+                             tag="conversation.item.input_audio_transcription.completed"):
+    transcript: str = ""
+
+
+class TextDelta(msgspec.Struct, tag_field="type", tag="response.text.delta"):
+    delta: str = ""
+
+
+class FunctionCallArgumentsDone(msgspec.Struct, tag_field="type",
+                                tag="response.function_call_arguments.done"):
+    call_id: str = ""
+    name: str = ""
+    arguments: str = "{}"
+
+
+class ErrorEvent(msgspec.Struct, tag_field="type", tag="error"):
+    error: dict = msgspec.field(default_factory=dict)
+
+
+ServerEvent = Union[
+    AudioDelta,
+    ResponseDone,
+    TranscriptionCompleted,
+    TextDelta,
+    FunctionCallArgumentsDone,
+    ErrorEvent,
+]
+
+
+class ServerEventDecoder:
+    """Reusable decoder for the server events the assistant acts on
+
+    Only the fields we read are declared; everything else in a frame is
+    skipped by msgspec without being materialized.
+    """
+
+    def __init__(self):
+        self._decoder = msgspec.json.Decoder(ServerEvent)
+
+    def decode(self, message) -> Union[ServerEvent, None]:
+        """
+        Decode one WebSocket frame
+
+        Args:
+            message: Raw frame (str or bytes)
+
+        Returns:
+            Typed event, or None for event types the assistant ignores
+        """
+        try:
+            return self._decoder.decode(message)
+        except msgspec.ValidationError:
+            # Unknown tag (session.created, rate_limits.updated, ...) -
+            # nothing dispatches on these
+            return None
@@ -1,10 +1,10 @@
 """Simple rear camera capture using GStreamer (for Jetson CSI cameras)"""
 
 import threading
+import time
 import logging
 from typing import Optional
 import numpy as np
-import cv2
 import gi
 gi.require_version('Gst', '1.0')
 from gi.repository import Gst
@@ -18,6 +18,9 @@ Gst.init(None)
 class RearCamera:
     """Rear camera handler for CSI camera using GStreamer"""
 
+    # Samples are dropped without copying once get_frame hasn't been called for this long
+    CONSUMER_TIMEOUT_S = 1.0
+
     def __init__(self, camera_id=0):
         self.camera_id = camera_id
         self.pipeline = None
@@ -27,6 +30,14 @@ class RearCamera:
         self.frame_lock = threading.Lock()
         self.width = 720
         self.height = 1280
+        # Double buffer (allocated in start, once the output size is fixed):
+        # the pull thread fills the back buffer, then swaps it in, so no
+        # frame-sized array is allocated per sample
+        self._frames = None
+        self._back = 0
+        self._last_get_ts = 0.0  # monotonic time of the last get_frame call
+        self._frame_ts = 0.0  # monotonic time current_frame was captured
+        self._enabled = True  # False while paused by the power profile
 
     def start(self, use_gstreamer=True):
         """Start camera capture using GStreamer"""
@@ -42,10 +53,14 @@ class RearCamera:
                 f"nvvidconv flip-method=3 ! "
                 f"video/x-raw, width={self.width}, height={self.height}, format=BGRx ! "
                 f"videoconvert ! "
-                f"video/x-raw, format=BGR ! "
-                f"appsink name=sink emit-signals=true max-buffers=1 drop=true sync=false"
+                f"video/x-raw, format=RGB ! "
+                f"appsink name=sink emit-signals=false max-buffers=1 drop=true sync=false"
             )
 
+            shape = (self.height, self.width, 3)
+            if self._frames is None or self._frames[0].shape != shape:
+                self._frames = [np.empty(shape, dtype=np.uint8) for _ in range(2)]
+
             print(f"Starting rear camera with GStreamer pipeline:")
             print(f"  sensor-id={self.camera_id}, output={self.width}x{self.height}")
 
@@ -53,9 +68,6 @@ class RearCamera:
             self.pipeline = Gst.parse_launch(pipeline_str)
             self.appsink = self.pipeline.get_by_name('sink')
 
-            # Connect to new-sample signal
-            self.appsink.connect('new-sample', self._on_new_sample)
-
             # Start pipeline
             ret = self.pipeline.set_state(Gst.State.PLAYING)
             if ret == Gst.StateChangeReturn.FAILURE:
@@ -63,6 +75,12 @@ class RearCamera:
                 return False
 
             self.running = True
+
+            # Pull samples on our own thread instead of running Python in
+            # GStreamer's streaming thread for every buffer
+            self.thread = threading.Thread(target=self._pull_loop, daemon=True)
+            self.thread.start()
+
             print(f"Rear camera started successfully (sensor-id {self.camera_id})")
             logger.info(f"Rear camera started on sensor {self.camera_id}")
             return True
@@ -73,54 +91,102 @@ class RearCamera:
             traceback.print_exc()
             return False
 
-    def _on_new_sample(self, appsink):
-        """Callback for new frame from GStreamer"""
-        try:
-            # Pull sample from appsink
-            sample = appsink.emit('pull-sample')
+    def _pull_loop(self):
+        """Pull frames from the appsink while the camera is running"""
+        timeout_ns = Gst.SECOND // 10
+        while self.running:
+            sample = self.appsink.try_pull_sample(timeout_ns)
             if sample is None:
-                return Gst.FlowReturn.OK
-
+                continue
+            # Nobody is reading frames: drop the sample without copying it
+            if time.monotonic() - self._last_get_ts > self.CONSUMER_TIMEOUT_S:
+                continue
+            # Stray sample delivered while pausing
+            if not self._enabled:
+                continue
+            self._handle_sample(sample)
+
+    def _handle_sample(self, sample):
+        """Copy one appsink sample into the frame buffers"""
+        try:
             # Get buffer from sample
             buf = sample.get_buffer()
-            caps = sample.get_caps()
 
             # Get buffer data
             success, map_info = buf.map(Gst.MapFlags.READ)
             if not success:
-                return Gst.FlowReturn.OK
+                return
 
-            # Convert to numpy array
-            frame = np.ndarray(
-                shape=(self.height, self.width, 3),
-                dtype=np.uint8,
-                buffer=map_info.data
-            )
+            # View the mapped buffer as an HxWx3 array (no copy yet)
+            dst = self._frames[self._back]
+            frame = np.frombuffer(map_info.data, dtype=np.uint8, count=dst.size).reshape(dst.shape)
 
-            # Store frame (make a copy since buffer will be unmapped)
+            # Copy out before the buffer is unmapped, then publish the filled buffer
+            np.copyto(dst, frame)
             with self.frame_lock:
-                self.current_frame = frame.copy()
+                self.current_frame = dst
+                self._frame_ts = time.monotonic()
+            self._back ^= 1
 
             # Unmap buffer
             buf.unmap(map_info)
 
-            return Gst.FlowReturn.OK
-
         except Exception as e:
-            logger.error(f"Error in frame callback: {e}")
-            return Gst.FlowReturn.ERROR
+            logger.error(f"Error handling camera frame: {e}")
 
     def stop(self):
         """Stop camera capture"""
         self.running = False
+        if self.thread:
+            self.thread.join(timeout=1)
+            self.thread = None
         if self.pipeline:
             self.pipeline.set_state(Gst.State.NULL)
         logger.info("Rear camera stopped")
 
+    def pause(self):
+        """Pause capture at the source (sensor, ISP and conversion stop producing buffers)"""
+        self._enabled = False
+        if self.running and self.pipeline:
+            self.pipeline.set_state(Gst.State.PAUSED)
+            logger.info("Rear camera paused")
+
+    def resume(self):
+        """Resume capture after pause()"""
+        if self.running and self.pipeline:
+            self.pipeline.set_state(Gst.State.PLAYING)
+            logger.info("Rear camera resumed")
+        self._enabled = True
+
+    def on_power_profile(self, profile, config: dict):
+        """
+        PowerManager profile-change callback: pause or resume with the profile
+
+        Args:
+            profile: New PowerProfile
+            config: Profile config; features['rear_camera'] enables capture
+        """
+        if config['features'].get('rear_camera', True):
+            self.resume()
+        else:
+            self.pause()
+
     def get_frame(self) -> Optional[np.ndarray]:
-        """Get current frame (BGR format from GStreamer, convert to RGB)"""
+        """
+        Get current frame (RGB, converted in the GStreamer pipeline)
+
+        Frames are only captured while this is being called, so the first call
+        after an idle period (or while paused) returns None rather than a
+        frame from before it; capture picks up again from that call.
+
+        Returns:
+            One of two internal buffers, overwritten in place two frames later:
+            copy it if it has to outlive the next get_frame call. None if no
+            frame newer than CONSUMER_TIMEOUT_S is available.
+        """
+        now = time.monotonic()
+        self._last_get_ts = now
         with self.frame_lock:
-            if self.current_frame is not None:
-                # GStreamer gives us BGR, convert to RGB
-                return cv2.cvtColor(self.current_frame, cv2.COLOR_BGR2RGB)
-        return None
+            if now - self._frame_ts > self.CONSUMER_TIMEOUT_S:
+                return None
+            return self.current_frame
@@ -1,44 +1,97 @@
 """System telemetry monitoring for Jetson Orin Nano"""
 
+import os
+import selectors
+import subprocess
 import threading
 import time
 import logging
 import re
-from typing import Dict, Optional, Callable
+import traceback
+from dataclasses import dataclass, replace
+from typing import Dict, Optional, Callable, Tuple
 from pathlib import Path
+from statistics import fmean
+
+try:
+    from jtop import jtop, JtopException
+    JTOP_AVAILABLE = True
+except ImportError:
+    JTOP_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+HISTORY_SIZE = 64  # Snapshots kept for get_history (power of two)
+
+# Every tegrastats field in one alternation, so a line is scanned once;
+# the outer named group tells the parser which field matched
+_TEGRASTATS_RE = re.compile(
+    r'(?P<ram>RAM (?P<ram_used>\d+)/(?P<ram_total>\d+)MB)'
+    r'|(?P<swap>SWAP (?P<swap_used>\d+)/(?P<swap_total>\d+)MB)'
+    r'|(?P<cpu>CPU \[(?P<cpu_data>[\d%@,]+)\])'
+    r'|(?P<gpu>GR3D_FREQ (?P<gpu_pct>\d+)%)'
+    r'|(?P<temp>(?P<temp_name>\w+)@(?P<temp_val>[\d.]+)C)'
+    r'|(?P<power>VDD_(?P<rail>IN|CPU_GPU_CV|SOC) (?P<power_mw>\d+)mW)'
+)
+
+# Named temperature sensors and power rails -> telemetry keys
+_TEMP_KEYS = {'cpu': 'cpu_temp', 'gpu': 'gpu_temp', 'tj': 'tj_temp'}
+_POWER_KEYS = {'IN': 'power_total_mw', 'CPU_GPU_CV': 'power_cpu_gpu_mw', 'SOC': 'power_soc_mw'}
+
+
+@dataclass(frozen=True, slots=True)
+class TelemetrySnapshot:
+    """Immutable telemetry reading; safe to share between threads without copying"""
+    cpu_usage: float = 0.0  # Average CPU usage %
+    cpu_per_core: Tuple[int, ...] = ()  # Per-core usage
+    gpu_usage: float = 0.0  # GPU usage %
+    ram_used_mb: int = 0
+    ram_total_mb: int = 0
+    ram_usage: float = 0.0  # RAM usage %
+    swap_used_mb: int = 0
+    swap_total_mb: int = 0
+    cpu_temp: float = 0.0  # °C
+    gpu_temp: float = 0.0  # °C
+    soc_temp: float = 0.0  # °C (average of soc0/1/2)
+    tj_temp: float = 0.0   # Junction temp
+    power_total_mw: int = 0  # Total power draw (VDD_IN)
+    power_cpu_gpu_mw: int = 0  # CPU+GPU power
+    power_soc_mw: int = 0  # SoC power
+    link_rtt_ms: Optional[float] = None  # Assistant websocket round-trip time
+    timestamp: float = 0.0
+
 
 class SystemMonitor:
     """Monitor Jetson system telemetry: CPU/GPU usage, temps, power, RAM"""
 
-    def __init__(self):
+    def __init__(self, use_jtop: bool = True):
+        """
+        Args:
+            use_jtop: Read telemetry from the jtop service when jetson-stats is
+                installed (no subprocess or text parsing), else run tegrastats
+        """
         self.is_running = False
         self.thread = None
         self.callback = None
-
-        # Latest telemetry data
-        self.telemetry = {
-            'cpu_usage': 0.0,  # Average CPU usage %
-            'cpu_per_core': [],  # Per-core usage
-            'gpu_usage': 0.0,  # GPU usage %
-            'ram_used_mb': 0,
-            'ram_total_mb': 0,
-            'ram_usage': 0.0,  # RAM usage %
-            'swap_used_mb': 0,
-            'swap_total_mb': 0,
-            'cpu_temp': 0.0,  # °C
-            'gpu_temp': 0.0,  # °C
-            'soc_temp': 0.0,  # °C (average of soc0/1/2)
-            'tj_temp': 0.0,   # Junction temp
-            'power_total_mw': 0,  # Total power draw (VDD_IN)
-            'power_cpu_gpu_mw': 0,  # CPU+GPU power
-            'power_soc_mw': 0,  # SoC power
-            'timestamp': 0.0
-        }
-
-        # Thermal zone mapping
+        self.force_emit_interval_s = 5.0  # Callback heartbeat while readings are steady
+        self._last_emit_key = None
+        self._last_emit_temp = 0.0
+        self._last_emit_ts = 0.0
+        self.use_jtop = use_jtop and JTOP_AVAILABLE
+
+        # Latest telemetry, replaced wholesale on every update, plus a ring of
+        # the most recent snapshots (single writer: the monitor thread)
+        self._snapshot = TelemetrySnapshot()
+        self._ring = [self._snapshot] * HISTORY_SIZE
+        self._ring_idx = 0
+        self._publish_lock = threading.Lock()  # Writers only; see _publish
+
+        # get_status_brief result for the snapshot it was formatted from
+        self._brief_snapshot = None
+        self._brief_cache = ''
+
+        # Thermal zone mapping (temp files are kept open and re-read with pread)
+        self._zone_fds: Dict[str, int] = {}
         self.thermal_zones = self._detect_thermal_zones()
         logger.info(f"Detected thermal zones: {self.thermal_zones}")
 
@@ -54,6 +107,10 @@ class SystemMonitor:
             if type_file.exists():
                 zone_type = type_file.read_text().strip()
                 zones[zone_type] = zone_num
+                try:
+                    self._zone_fds[zone_type] = os.open(str(zone_dir / "temp"), os.O_RDONLY)
+                except OSError:
+                    pass
 
         return zones
 
@@ -62,16 +119,71 @@ class SystemMonitor:
         if zone_name not in self.thermal_zones:
             return 0.0
 
-        zone_num = self.thermal_zones[zone_name]
-        temp_file = Path(f"/sys/class/thermal/thermal_zone{zone_num}/temp")
-
         try:
-            # Temperature is in millidegrees Celsius
-            temp_millidegrees = int(temp_file.read_text().strip())
+            fd = self._zone_fds.get(zone_name)
+            if fd is None:
+                zone_num = self.thermal_zones[zone_name]
+                fd = os.open(f"/sys/class/thermal/thermal_zone{zone_num}/temp", os.O_RDONLY)
+                self._zone_fds[zone_name] = fd
+
+            # sysfs regenerates the value on a read at offset 0, so one pread
+            # replaces open/read/close. Temperature is in millidegrees Celsius
+            temp_millidegrees = int(os.pread(fd, 16, 0).strip())
             return temp_millidegrees / 1000.0
         except:
             return 0.0
 
+    def _close_thermal_zones(self):
+        """Close the cached thermal zone file descriptors"""
+        for fd in self._zone_fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._zone_fds.clear()
+
+    def _publish(self, new_reading: bool = True, **changes):
+        """
+        Derive a snapshot from the current one and publish it
+
+        Writers (the monitor thread and set_link_rtt) are serialized so neither
+        loses the other's fields; readers never lock, they just load
+        self._snapshot, which is replaced by a single attribute store.
+
+        Args:
+            new_reading: Advance the history ring (False updates the newest
+                entry in place, e.g. for the link RTT)
+            **changes: TelemetrySnapshot fields to change
+        """
+        with self._publish_lock:
+            snapshot = replace(self._snapshot, **changes)
+            idx = self._ring_idx
+            if new_reading:
+                idx = (idx + 1) & (HISTORY_SIZE - 1)
+            self._ring[idx] = snapshot
+            # Readers index the ring through _ring_idx, so advance it only once
+            # the slot holds the new snapshot
+            self._ring_idx = idx
+            self._snapshot = snapshot
+
+    def _emit(self):
+        """Call the registered callback if the latest reading moved noticeably"""
+        if not self.callback:
+            return
+
+        t = self._snapshot
+        key = (round(t.cpu_usage), t.gpu_usage, t.power_total_mw, t.ram_used_mb)
+        now = time.monotonic()
+        if (key == self._last_emit_key
+                and abs(t.cpu_temp - self._last_emit_temp) < 0.5
+                and now - self._last_emit_ts < self.force_emit_interval_s):
+            return
+
+        self._last_emit_key = key
+        self._last_emit_temp = t.cpu_temp
+        self._last_emit_ts = now
+        self.callback(t)
+
     def _parse_tegrastats_line(self, line: str) -> bool:
         """
         Parse a single line of tegrastats output
@@ -83,96 +195,168 @@ class SystemMonitor:
         VDD_IN 6030mW/6030mW VDD_CPU_GPU_CV 1913mW/1913mW VDD_SOC 1557mW/1557mW
         """
         try:
-            # RAM: "RAM 5173/7620MB"
-            ram_match = re.search(r'RAM (\d+)/(\d+)MB', line)
-            if ram_match:
-                self.telemetry['ram_used_mb'] = int(ram_match.group(1))
-                self.telemetry['ram_total_mb'] = int(ram_match.group(2))
-                self.telemetry['ram_usage'] = (self.telemetry['ram_used_mb'] / self.telemetry['ram_total_mb']) * 100
-
-            # SWAP: "SWAP 111/3810MB"
-            swap_match = re.search(r'SWAP (\d+)/(\d+)MB', line)
-            if swap_match:
-                self.telemetry['swap_used_mb'] = int(swap_match.group(1))
-                self.telemetry['swap_total_mb'] = int(swap_match.group(2))
-
-            # CPU: "CPU [45%@1728,30%@1728,...]"
-            cpu_match = re.search(r'CPU \[([\d%@,]+)\]', line)
-            if cpu_match:
-                cpu_data = cpu_match.group(1)
-                # Extract percentages: "45%@1728,30%@1728,..." -> [45, 30, ...]
-                percentages = re.findall(r'(\d+)%', cpu_data)
-                self.telemetry['cpu_per_core'] = [int(p) for p in percentages]
-                self.telemetry['cpu_usage'] = sum(self.telemetry['cpu_per_core']) / len(self.telemetry['cpu_per_core']) if self.telemetry['cpu_per_core'] else 0.0
-
-            # GPU: "GR3D_FREQ 55%"
-            gpu_match = re.search(r'GR3D_FREQ (\d+)%', line)
-            if gpu_match:
-                self.telemetry['gpu_usage'] = int(gpu_match.group(1))
-
-            # Temperatures: "cpu@48.781C gpu@50.718C tj@50.718C soc0@48.156C soc1@48.281C soc2@48.093C"
-            temp_matches = re.findall(r'(\w+)@([\d.]+)C', line)
+            # Collect into a local dict and publish one new snapshot at the end
+            out = {}
             soc_temps = []
-            for name, temp in temp_matches:
-                temp_val = float(temp)
-                if name == 'cpu':
-                    self.telemetry['cpu_temp'] = temp_val
-                elif name == 'gpu':
-                    self.telemetry['gpu_temp'] = temp_val
-                elif name == 'tj':
-                    self.telemetry['tj_temp'] = temp_val
-                elif name.startswith('soc'):
-                    soc_temps.append(temp_val)
+            for m in _TEGRASTATS_RE.finditer(line):
+                kind = m.lastgroup
+                if kind == 'temp':
+                    # "cpu@48.781C gpu@50.718C tj@50.718C soc0@48.156C ..."
+                    name = m.group('temp_name')
+                    key = _TEMP_KEYS.get(name)
+                    if key:
+                        out[key] = float(m.group('temp_val'))
+                    elif name.startswith('soc'):
+                        soc_temps.append(float(m.group('temp_val')))
+                elif kind == 'power':
+                    # "VDD_IN 6030mW/6030mW VDD_CPU_GPU_CV 1913mW/1913mW VDD_SOC 1557mW/1557mW"
+                    out[_POWER_KEYS[m.group('rail')]] = int(m.group('power_mw'))
+                elif kind == 'cpu':
+                    # "CPU [45%@1728,30%@1728,...]" -> [45, 30, ...]
+                    per_core = []
+                    for tok in m.group('cpu_data').split(','):
+                        pct, sep, _ = tok.partition('%')
+                        if sep and pct:
+                            per_core.append(int(pct))
+                    out['cpu_per_core'] = tuple(per_core)
+                    out['cpu_usage'] = fmean(per_core) if per_core else 0.0
+                elif kind == 'gpu':
+                    # "GR3D_FREQ 55%"
+                    out['gpu_usage'] = int(m.group('gpu_pct'))
+                elif kind == 'ram':
+                    # "RAM 5173/7620MB"
+                    used, total = int(m.group('ram_used')), int(m.group('ram_total'))
+                    out['ram_used_mb'] = used
+                    out['ram_total_mb'] = total
+                    out['ram_usage'] = (used / total) * 100
+                elif kind == 'swap':
+                    # "SWAP 111/3810MB"
+                    out['swap_used_mb'] = int(m.group('swap_used'))
+                    out['swap_total_mb'] = int(m.group('swap_total'))
 
             if soc_temps:
-                self.telemetry['soc_temp'] = sum(soc_temps) / len(soc_temps)
+                out['soc_temp'] = fmean(soc_temps)
 
-            # Power: "VDD_IN 6030mW/6030mW VDD_CPU_GPU_CV 1913mW/1913mW VDD_SOC 1557mW/1557mW"
-            power_in_match = re.search(r'VDD_IN (\d+)mW', line)
-            if power_in_match:
-                self.telemetry['power_total_mw'] = int(power_in_match.group(1))
-
-            power_cpu_gpu_match = re.search(r'VDD_CPU_GPU_CV (\d+)mW', line)
-            if power_cpu_gpu_match:
-                self.telemetry['power_cpu_gpu_mw'] = int(power_cpu_gpu_match.group(1))
-
-            power_soc_match = re.search(r'VDD_SOC (\d+)mW', line)
-            if power_soc_match:
-                self.telemetry['power_soc_mw'] = int(power_soc_match.group(1))
-
-            self.telemetry['timestamp'] = time.time()
+            self._publish(timestamp=time.time(), **out)
             return True
 
         except Exception as e:
             logger.error(f"Error parsing tegrastats line: {e}")
             return False
 
-    def _monitor_loop(self):
-        """Background monitoring loop using tegrastats"""
-        import subprocess
+    def _populate_from_jtop(self, stats: Dict, memory: Dict):
+        """
+        Publish a snapshot from jtop's pre-parsed stats
+
+        Args:
+            stats: jtop.stats ('CPU1'..'CPUn', 'GPU', 'Temp <sensor>', 'Power <rail>')
+            memory: jtop.memory ('RAM'/'SWAP' with 'tot'/'used' in kB)
+        """
+        out = {}
+        per_core = []
+        soc_temps = []
+        for key, value in stats.items():
+            if not isinstance(value, (int, float)):
+                continue  # Offline cores report 'OFF'
+            if key.startswith('CPU'):
+                per_core.append(int(value))
+            elif key == 'GPU':
+                out['gpu_usage'] = value
+            elif key.startswith('Temp '):
+                name = key[5:].lower()
+                temp_key = _TEMP_KEYS.get(name)
+                if temp_key:
+                    out[temp_key] = float(value)
+                elif name.startswith('soc'):
+                    soc_temps.append(float(value))
+            elif key.startswith('Power VDD_'):
+                power_key = _POWER_KEYS.get(key[10:])
+                if power_key:
+                    out[power_key] = int(value)
+
+        if per_core:
+            out['cpu_per_core'] = tuple(per_core)
+            out['cpu_usage'] = fmean(per_core)
+        if soc_temps:
+            out['soc_temp'] = fmean(soc_temps)
+        if 'power_total_mw' not in out and isinstance(stats.get('Power TOT'), (int, float)):
+            out['power_total_mw'] = int(stats['Power TOT'])
+
+        ram = memory.get('RAM')
+        if ram and ram.get('tot'):
+            out['ram_used_mb'] = ram['used'] // 1024
+            out['ram_total_mb'] = ram['tot'] // 1024
+            out['ram_usage'] = (ram['used'] / ram['tot']) * 100
+        swap = memory.get('SWAP')
+        if swap and 'tot' in swap:
+            out['swap_used_mb'] = swap['used'] // 1024
+            out['swap_total_mb'] = swap['tot'] // 1024
+
+        self._publish(timestamp=time.time(), **out)
+
+    def _run_jtop(self) -> bool:
+        """
+        Monitoring loop fed by the jtop service
 
+        Returns:
+            False if the jtop service could not be reached (caller falls back
+            to tegrastats)
+        """
+        try:
+            jetson = jtop(interval=1.0)
+            jetson.start()
+        except JtopException as e:
+            logger.warning(f"jtop service unavailable, falling back to tegrastats: {e}")
+            return False
+
+        logger.info("Reading telemetry from jtop")
+        try:
+            # ok() blocks until jtop publishes the next sample
+            while self.is_running and jetson.ok():
+                self._populate_from_jtop(jetson.stats, jetson.memory)
+                self._emit()
+        finally:
+            jetson.close()
+        return True
+
+    def _monitor_loop(self):
+        """Background monitoring loop using jtop, or tegrastats as a fallback"""
         logger.info("Starting system monitor loop...")
 
         try:
+            if self.use_jtop and self._run_jtop():
+                logger.info("System monitor loop stopped")
+                return
+
             # Run tegrastats with 1 second interval
             process = subprocess.Popen(
                 ['tegrastats', '--interval', '1000'],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.DEVNULL,
-                universal_newlines=True,
-                bufsize=1
             )
 
-            while self.is_running:
-                line = process.stdout.readline()
-                if not line:
-                    break
-
-                # Parse the line
-                if self._parse_tegrastats_line(line):
-                    # Call callback if registered
-                    if self.callback:
-                        self.callback(self.telemetry.copy())
+            # Poll the pipe instead of blocking in readline, so stop() is
+            # noticed within one poll timeout rather than one tegrastats interval
+            fd = process.stdout.fileno()
+            sel = selectors.DefaultSelector()
+            sel.register(fd, selectors.EVENT_READ)
+            pending = b''
+
+            try:
+                while self.is_running:
+                    if not sel.select(timeout=0.2):
+                        continue
+                    chunk = os.read(fd, 4096)
+                    if not chunk:
+                        break  # tegrastats exited
+
+                    *lines, pending = (pending + chunk).split(b'\n')
+                    for raw in lines:
+                        # Parse the line
+                        if self._parse_tegrastats_line(raw.decode(errors='replace')):
+                            self._emit()
+            finally:
+                sel.close()
 
             # Cleanup
             process.terminate()
@@ -180,17 +364,17 @@ class SystemMonitor:
 
         except Exception as e:
             logger.error(f"System monitor error: {e}")
-            import traceback
             traceback.print_exc()
 
         logger.info("System monitor loop stopped")
 
-    def start(self, callback: Optional[Callable[[Dict], None]] = None):
+    def start(self, callback: Optional[Callable[[TelemetrySnapshot], None]] = None):
         """
         Start system monitoring
 
         Args:
-            callback: Optional function called with telemetry dict on each update
+            callback: Optional function called with a TelemetrySnapshot when the
+                readings change (and at least every force_emit_interval_s)
         """
         if self.is_running:
             return
@@ -209,12 +393,41 @@ class SystemMonitor:
         self.is_running = False
         if self.thread:
             self.thread.join(timeout=3)
+        self._close_thermal_zones()
 
         logger.info("System monitor stopped")
 
-    def get_telemetry(self) -> Dict:
+    def __del__(self):
+        self._close_thermal_zones()
+
+    def set_link_rtt(self, rtt_ms: Optional[float]):
+        """
+        Record the voice assistant's websocket round-trip time
+
+        Args:
+            rtt_ms: Latest ping RTT in milliseconds (None if disconnected)
+        """
+        self._publish(new_reading=False, link_rtt_ms=rtt_ms)
+
+    def get_telemetry(self) -> TelemetrySnapshot:
         """Get latest telemetry snapshot"""
-        return self.telemetry.copy()
+        return self._snapshot
+
+    def get_history(self, count: int = HISTORY_SIZE) -> Tuple[TelemetrySnapshot, ...]:
+        """
+        Get the most recent telemetry snapshots without copying them
+
+        Args:
+            count: Number of snapshots wanted (at most HISTORY_SIZE)
+
+        Returns:
+            Snapshots ordered oldest to newest (padded with the initial empty
+            snapshot until the ring has filled)
+        """
+        idx = self._ring_idx
+        ring = self._ring
+        count = min(count, HISTORY_SIZE)
+        return tuple(ring[(idx - k) & (HISTORY_SIZE - 1)] for k in range(count - 1, -1, -1))
 
     def get_status_brief(self) -> str:
         """
@@ -222,31 +435,35 @@ class SystemMonitor:
 
         Returns concise summary of system state
         """
-        t = self.telemetry
+        t = self._snapshot
+        if t is self._brief_snapshot:
+            return self._brief_cache  # No new telemetry since the last call
 
         # Format brief status
         brief = (
             f"System status: "
-            f"CPU at {t['cpu_usage']:.0f}%, {t['cpu_temp']:.0f}°C. "
-            f"GPU at {t['gpu_usage']:.0f}%, {t['gpu_temp']:.0f}°C. "
-            f"RAM {t['ram_usage']:.0f}% used, {t['ram_used_mb']:.0f} of {t['ram_total_mb']:.0f} megabytes. "
-            f"Total power draw {t['power_total_mw']/1000:.1f} watts."
+            f"CPU at {t.cpu_usage:.0f}%, {t.cpu_temp:.0f}°C. "
+            f"GPU at {t.gpu_usage:.0f}%, {t.gpu_temp:.0f}°C. "
+            f"RAM {t.ram_usage:.0f}% used, {t.ram_used_mb:.0f} of {t.ram_total_mb:.0f} megabytes. "
+            f"Total power draw {t.power_total_mw/1000:.1f} watts."
         )
 
         # Add warnings if needed
         warnings = []
-        if t['cpu_temp'] > 70:
+        if t.cpu_temp > 70:
             warnings.append("CPU temperature elevated")
-        if t['gpu_temp'] > 70:
+        if t.gpu_temp > 70:
             warnings.append("GPU temperature elevated")
-        if t['ram_usage'] > 85:
+        if t.ram_usage > 85:
             warnings.append("RAM usage high")
-        if t['power_total_mw'] > 15000:  # >15W
+        if t.power_total_mw > 15000:  # >15W
             warnings.append("High power consumption")
 
         if warnings:
             brief += " Warnings: " + ", ".join(warnings) + "."
 
+        self._brief_cache = brief
+        self._brief_snapshot = t
         return brief
 
 
@@ -265,15 +482,15 @@ if __name__ == "__main__":
     def print_telemetry(telemetry):
         """Print telemetry updates"""
         print(f"\n{'='*60}")
-        print(f"CPU: {telemetry['cpu_usage']:.1f}% avg, {telemetry['cpu_temp']:.1f}°C")
-        print(f"  Per-core: {telemetry['cpu_per_core']}")
-        print(f"GPU: {telemetry['gpu_usage']:.0f}%, {telemetry['gpu_temp']:.1f}°C")
-        print(f"RAM: {telemetry['ram_used_mb']}/{telemetry['ram_total_mb']}MB ({telemetry['ram_usage']:.1f}%)")
-        print(f"SWAP: {telemetry['swap_used_mb']}/{telemetry['swap_total_mb']}MB")
-        print(f"SoC: {telemetry['soc_temp']:.1f}°C, Junction: {telemetry['tj_temp']:.1f}°C")
-        print(f"Power: {telemetry['power_total_mw']/1000:.1f}W total, "
-              f"{telemetry['power_cpu_gpu_mw']/1000:.1f}W CPU+GPU, "
-              f"{telemetry['power_soc_mw']/1000:.1f}W SoC")
+        print(f"CPU: {telemetry.cpu_usage:.1f}% avg, {telemetry.cpu_temp:.1f}°C")
+        print(f"  Per-core: {telemetry.cpu_per_core}")
+        print(f"GPU: {telemetry.gpu_usage:.0f}%, {telemetry.gpu_temp:.1f}°C")
+        print(f"RAM: {telemetry.ram_used_mb}/{telemetry.ram_total_mb}MB ({telemetry.ram_usage:.1f}%)")
+        print(f"SWAP: {telemetry.swap_used_mb}/{telemetry.swap_total_mb}MB")
+        print(f"SoC: {telemetry.soc_temp:.1f}°C, Junction: {telemetry.tj_temp:.1f}°C")
+        print(f"Power: {telemetry.power_total_mw/1000:.1f}W total, "
+              f"{telemetry.power_cpu_gpu_mw/1000:.1f}W CPU+GPU, "
+              f"{telemetry.power_soc_mw/1000:.1f}W SoC")
         print(f"{'='*60}")
 
     monitor = SystemMonitor()
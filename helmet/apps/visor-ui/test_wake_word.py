@@ -3,6 +3,9 @@
 
 import sys
 import time
+import traceback
+
+import numpy as np
 
 # Test 1: Check openwakeword installation
 print("=" * 60)
@@ -51,7 +54,6 @@ try:
     print(f"  Available models: {list(model.models.keys())}")
 except Exception as e:
     print(f"✗ Failed to load model: {e}")
-    import traceback
     traceback.print_exc()
     sys.exit(1)
 
@@ -60,6 +62,7 @@ print("\n[5/6] Opening audio stream on device 4...")
 DEVICE_INDEX = 4
 TARGET_RATE = 16000
 CHUNK = 1280
+PREDICT_BATCH = 3  # Chunks per model.predict call (~240 ms of audio)
 
 p = pyaudio.PyAudio()
 try:
@@ -108,8 +111,6 @@ print(f"Listening for 'hey jarvis' for 30 seconds...")
 print("(Try saying 'hey jarvis' into the microphone)")
 print("-" * 60)
 
-import numpy as np
-
 try:
     stream = p.open(
         format=pyaudio.paInt16,
@@ -125,34 +126,39 @@ try:
     max_score = 0.0
 
     while time.time() - start_time < 30:
-        # Read audio
-        audio_data = stream.read(CHUNK, exception_on_overflow=False)
+        # Read audio (PyAudio has no read-into; frombuffer wraps the returned
+        # bytes without copying them)
+        audio_data = stream.read(CHUNK * PREDICT_BATCH, exception_on_overflow=False)
         audio_array = np.frombuffer(audio_data, dtype=np.int16)
 
-        # Get prediction
+        # Get prediction for the whole batch in one call: openwakeword still
+        # scores every 1280-sample frame and returns the max over them, so the
+        # per-chunk threshold check is unchanged
         prediction = model.predict(audio_array)
 
-        frame_count += 1
+        frame_count += PREDICT_BATCH
 
-        # Track max score
+        # Track max score and check for detection (threshold 0.5) in one pass
+        detected = None
         for keyword, score in prediction.items():
             if score > max_score:
                 max_score = score
+            if detected is None and score > 0.5:
+                detected = (keyword, score)
 
-        # Print status every 50 frames (~4 seconds)
-        if frame_count % 50 == 0:
+        # Print status every ~50 frames (~4 seconds)
+        if frame_count % (16 * PREDICT_BATCH) == 0:
             elapsed = time.time() - start_time
             scores_str = ", ".join([f"{k}: {v:.3f}" for k, v in prediction.items()])
             print(f"[{elapsed:5.1f}s] {scores_str} (max so far: {max_score:.3f})")
 
-        # Check for detection (threshold 0.5)
-        for keyword, score in prediction.items():
-            if score > 0.5:
-                print(f"\n🎤 WAKE WORD DETECTED: '{keyword}' (confidence: {score:.2f})")
-                print(f"✓ Wake word detection is working!")
-                stream.close()
-                p.terminate()
-                sys.exit(0)
+        if detected:
+            keyword, score = detected
+            print(f"\n🎤 WAKE WORD DETECTED: '{keyword}' (confidence: {score:.2f})")
+            print(f"✓ Wake word detection is working!")
+            stream.close()
+            p.terminate()
+            sys.exit(0)
 
     stream.close()
     p.terminate()
@@ -170,7 +176,6 @@ except KeyboardInterrupt:
     p.terminate()
 except Exception as e:
     print(f"\n✗ Error during detection: {e}")
-    import traceback
     traceback.print_exc()
     stream.close()
     p.terminate()
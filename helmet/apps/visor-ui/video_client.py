@@ -2,6 +2,8 @@
 
 import grpc
 import logging
+import threading
+import time
 from typing import Optional
 
 import sys
@@ -14,27 +16,47 @@ logger = logging.getLogger(__name__)
 class VideoClient:
     """Client for video service communication"""
 
+    # Seconds to wait before reopening a broken frame stream
+    RECONNECT_DELAY_S = 1.0
+
     def __init__(self, server_address: str):
         self.server_address = server_address
         self.channel = None
         self.stub = None
+        # One request reused by every call (the source never changes)
+        self._request = helmet_pb2.FrameRequest(source="default")
+        # Newest frame from the background stream not yet taken by get_frame
+        # (each new frame replaces an untaken one)
+        self._latest = None
+        self._latest_lock = threading.Lock()
+        self._stream_call = None
+        self._running = False
+        self._stream_thread = None
         self._connect()
+        self._start_stream()
 
     def _connect(self):
         """Connect to video service"""
         try:
-            # Create channel with increased message size for high-res frames
+            # Create channel with increased message size for high-res frames.
+            # Keepalive pings keep the connection warm between polls, and a
+            # 1MB HTTP/2 window lets a whole frame arrive without stalling on
+            # flow-control updates
             options = [
                 ('grpc.max_send_message_length', 50 * 1024 * 1024),
                 ('grpc.max_receive_message_length', 50 * 1024 * 1024),
+                ('grpc.keepalive_time_ms', 30000),
+                ('grpc.keepalive_timeout_ms', 5000),
+                ('grpc.keepalive_permit_without_calls', 1),
+                ('grpc.http2.max_pings_without_data', 0),
+                ('grpc.http2.min_time_between_pings_ms', 10000),
+                ('grpc.http2.lookahead_bytes', 1024 * 1024),
             ]
             self.channel = grpc.insecure_channel(self.server_address, options=options)
             self.stub = helmet_pb2_grpc.VideoServiceStub(self.channel)
 
             # Test connection
-            request = helmet_pb2.FrameRequest()
-            request.source = "default"
-            response = self.stub.GetFrame(request, timeout=5)
+            response = self.stub.GetFrame(self._request, timeout=5)
 
             logger.info(f"Connected to video service at {self.server_address}")
 
@@ -42,25 +64,40 @@ class VideoClient:
             logger.error(f"Failed to connect to video service: {e}")
             raise
 
-    def get_frame(self) -> Optional[helmet_pb2.FrameMeta]:
-        """Get a single frame from video service"""
-        try:
-            if not self.stub:
-                return None
-
-            request = helmet_pb2.FrameRequest()
-            request.source = "default"
+    def _start_stream(self):
+        """Start the background thread that holds one StreamFrames call open"""
+        self._running = True
+        self._stream_thread = threading.Thread(target=self._stream_loop, daemon=True)
+        self._stream_thread.start()
+
+    def _stream_loop(self):
+        """Push streamed frames into the queue, reopening the stream if it breaks"""
+        while self._running:
+            try:
+                self._stream_call = self.stub.StreamFrames(self._request)
+                for frame_meta in self._stream_call:
+                    with self._latest_lock:
+                        self._latest = frame_meta
+            except grpc.RpcError as e:
+                if not self._running:
+                    break
+                logger.error(f"Video stream error: {e}")
+            except Exception as e:
+                logger.error(f"Unexpected error in frame stream: {e}")
+            if self._running:
+                time.sleep(self.RECONNECT_DELAY_S)
 
-            response = self.stub.GetFrame(request, timeout=1)
-            return response
+    def get_frame(self) -> Optional[helmet_pb2.FrameMeta]:
+        """
+        Take the newest frame from the background stream
 
-        except grpc.RpcError as e:
-            if e.code() != grpc.StatusCode.DEADLINE_EXCEEDED:
-                logger.error(f"Video service error: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error getting frame: {e}")
-            return None
+        Returns:
+            Newest frame not returned before, or None if no new frame has
+            arrived since the last call (keep showing the previous one)
+        """
+        with self._latest_lock:
+            frame_meta, self._latest = self._latest, None
+        return frame_meta
 
     def stream_frames(self):
         """Stream frames from video service"""
@@ -68,10 +105,7 @@ class VideoClient:
             if not self.stub:
                 return
 
-            request = helmet_pb2.FrameRequest()
-            request.source = "default"
-
-            for frame_meta in self.stub.StreamFrames(request):
+            for frame_meta in self.stub.StreamFrames(self._request):
                 yield frame_meta
 
         except grpc.RpcError as e:
@@ -81,6 +115,12 @@ class VideoClient:
 
     def disconnect(self):
         """Disconnect from video service"""
+        self._running = False
+        if self._stream_call is not None:
+            self._stream_call.cancel()
+        if self._stream_thread:
+            self._stream_thread.join(timeout=1)
+            self._stream_thread = None
         if self.channel:
             self.channel.close()
             logger.info("Disconnected from video service")
\ No newline at end of file
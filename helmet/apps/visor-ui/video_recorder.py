@@ -2,28 +2,80 @@
 
 import cv2
 import numpy as np
+import os
+import subprocess
 import threading
-import queue
 import time
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Callable
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Hardware H.264 encoders, in order of preference: NVENC on discrete GPUs, then
+# the Jetson on-die encoder (nvmpi build of ffmpeg, or the V4L2 M2M driver)
+_HW_ENCODERS = ('h264_nvenc', 'h264_nvmpi', 'h264_v4l2m2m')
+_HW_ENCODER_ARGS = {
+    'h264_nvenc': ['-preset', 'p4', '-tune', 'll', '-rc', 'vbr', '-cq', '23'],
+    'h264_nvmpi': ['-b:v', '8M'],
+    'h264_v4l2m2m': ['-b:v', '8M'],
+}
+
+# Conversions for the ffmpeg pipe (planar 4:2:0, half the bytes of packed
+# RGB, and the format every H.264 encoder wants) and for cv2.VideoWriter (BGR)
+_TO_I420 = {'rgb24': cv2.COLOR_RGB2YUV_I420, 'bgr24': cv2.COLOR_BGR2YUV_I420}
+_TO_BGR = {'rgb24': cv2.COLOR_RGB2BGR}
+PIPE_BATCH = 8  # Max frames per writev (and preallocated I420 buffers)
+
+# Frame ring sizing: up to 4 s at 30 fps, capped by memory (~1.4 s at 1080p)
+MAX_RING_SLOTS = 120
+RING_BUDGET_BYTES = 256 * 1024 * 1024
+
+
+def _encoder_works(encoder: str) -> bool:
+    """One-frame test encode: ffmpeg lists encoders it was built with even when
+    the hardware behind them is missing (e.g. h264_nvenc on a Jetson)"""
+    try:
+        result = subprocess.run([
+            'ffmpeg', '-hide_banner', '-loglevel', 'error',
+            '-f', 'lavfi', '-i', 'nullsrc=s=256x256',
+            '-frames:v', '1', '-c:v', encoder, '-f', 'null', '-'
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=3)
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return result.returncode == 0
+
+
+@lru_cache(maxsize=1)
+def _detect_hw_encoder() -> Optional[str]:
+    """Return the first hardware H.264 encoder that ffmpeg can actually use, or None"""
+    try:
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'],
+                                capture_output=True, text=True, timeout=3)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    for encoder in _HW_ENCODERS:
+        if encoder in result.stdout and _encoder_works(encoder):
+            return encoder
+    return None
+
 
 class VideoRecorder:
     """Record video from camera frames with configurable duration and quality"""
 
-    def __init__(self, output_dir: str = "recordings", fps: int = 30, codec: str = "mp4v"):
+    def __init__(self, output_dir: str = "recordings", fps: int = 30, codec: str = "mp4v",
+                 use_hwaccel: bool = True):
         """
         Initialize video recorder
 
         Args:
             output_dir: Directory to save recordings
             fps: Frames per second for output video
-            codec: FourCC codec code (mp4v, avc1, xvid, etc.)
+            codec: FourCC codec code (mp4v, avc1, xvid, etc.) for the software writer
+            use_hwaccel: Encode with a hardware H.264 encoder through ffmpeg when
+                one is available (falls back to cv2.VideoWriter otherwise)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -31,12 +83,31 @@ class VideoRecorder:
         self.fps = fps
         self.codec = codec
         self.fourcc = cv2.VideoWriter_fourcc(*codec)
+        # Hardware encoder, set by a background probe (ffmpeg test encodes can
+        # take seconds); recordings started before it finishes use cv2
+        self.hw_encoder = None
+        self._hw_probe = None
+        if use_hwaccel:
+            self._hw_probe = threading.Thread(target=self._probe_hw_encoder, daemon=True)
+            self._hw_probe.start()
 
         # Recording state
         self.is_recording = False
         self.video_writer = None
+        self._ffmpeg = None  # Hardware encoder process (replaces video_writer)
+        self._ffmpeg_pix_fmt = None  # Raw format fed to ffmpeg's stdin
+        self._i420_pool = []  # Reused cvtColor destinations for the pipe
         self.current_filename = None
-        self.frame_queue = queue.Queue(maxsize=120)  # 4 seconds buffer at 30fps
+        # Pre-allocated ring of frame slots (allocated on the first frame, once
+        # the size is known). head/tail only grow; slot = index % len(ring)
+        self._ring = None
+        self._ring_fmt = []
+        self._head = 0  # Next frame for the writer
+        self._tail = 0  # End of the frames committed to the writer
+        self._staged = 0  # Next slot for add_frame (frames in [tail, staged) not yet committed)
+        self._busy = None  # Lowest index the writer may still be reading, if any
+        self.commit_batch = 4  # Frames staged per commit (one lock + wakeup per batch)
+        self._frame_cond = threading.Condition()
         self.write_thread = None
 
         # Recording limits
@@ -50,6 +121,13 @@ class VideoRecorder:
 
         logger.info(f"Video recorder initialized (output: {self.output_dir}, fps: {fps}, codec: {codec})")
 
+    def _probe_hw_encoder(self):
+        """Background thread: pick the hardware encoder for later recordings"""
+        encoder = _detect_hw_encoder()
+        if encoder:
+            logger.info(f"Hardware encoder available: {encoder}")
+        self.hw_encoder = encoder
+
     def start_recording(
         self,
         duration_seconds: Optional[int] = None,
@@ -78,6 +156,7 @@ class VideoRecorder:
         self.max_duration_seconds = duration_seconds
         self.recording_start_time = time.time()
         self.frames_written = 0
+        self._head = self._tail = self._staged = 0
 
         self.is_recording = True
 
@@ -103,16 +182,27 @@ class VideoRecorder:
             logger.warning("Not currently recording")
             return None
 
-        self.is_recording = False
+        with self._frame_cond:
+            self._tail = self._staged  # Flush frames still staged
+            self.is_recording = False
+            self._frame_cond.notify()
 
         # Wait for write thread to finish
         if self.write_thread:
             self.write_thread.join(timeout=5)
 
+        # Give back the frame ring (up to RING_BUDGET_BYTES, shared with the GPU
+        # on Jetson) between recordings; the next one allocates it again
+        if not (self.write_thread and self.write_thread.is_alive()):
+            self._ring = None
+            self._ring_fmt = []
+
         # Close video writer
         if self.video_writer:
             self.video_writer.release()
             self.video_writer = None
+        if self._ffmpeg:
+            self._close_ffmpeg()
 
         elapsed = time.time() - self.recording_start_time if self.recording_start_time else 0
 
@@ -126,12 +216,14 @@ class VideoRecorder:
 
         return saved_file
 
-    def add_frame(self, frame: np.ndarray):
+    def add_frame(self, frame: np.ndarray, pix_fmt: str = 'rgb24'):
         """
         Add a frame to the recording
 
         Args:
-            frame: RGB frame (numpy array, height x width x 3)
+            frame: Packed frame (numpy array, height x width x 3)
+            pix_fmt: Channel order of frame, 'rgb24' or 'bgr24' (BGR frames,
+                e.g. straight from OpenCV capture, need no channel swap)
         """
         if not self.is_recording:
             return
@@ -144,56 +236,242 @@ class VideoRecorder:
                 self.stop_recording()
                 return
 
-        # Add to queue (non-blocking, drop oldest if full)
-        try:
-            self.frame_queue.put_nowait(frame.copy())
-        except queue.Full:
-            # Drop oldest frame and add new one
+        shape = frame.shape
+        if self._ring is None or (self._staged == 0 and self._ring.shape[1:] != shape):
+            self._allocate_ring(shape)
+        elif self._ring.shape[1:] != shape:
+            logger.warning(f"Frame size changed to {shape} mid-recording, dropping frame")
+            return
+
+        n = len(self._ring)
+        staged = self._staged
+        if staged - self._head >= n - 1:
+            with self._frame_cond:
+                # One slot stays reserved for the frame the writer is encoding,
+                # so the ring is full at n - 1 frames: commit what's staged and
+                # drop the oldest (no allocation)
+                self._tail = staged
+                self._head += 1
+                self._frame_cond.notify()
+            logger.warning("Frame ring full, dropped oldest frame")
+        # Writer stuck for a whole ring: this slot is still being read from, so
+        # drop this frame rather than overwrite it
+        busy = self._busy
+        if busy is not None and staged - busy >= n:
+            logger.warning("Frame ring full while encoder is stalled, dropped new frame")
+            return
+
+        # Copy into the pre-owned slot without the lock: the writer never
+        # touches a slot at or past tail
+        slot = staged % n
+        self._ring[slot] = frame
+        self._ring_fmt[slot] = pix_fmt
+        self._staged = staged = staged + 1
+
+        # Hand frames to the writer a batch at a time
+        if staged - self._tail >= self.commit_batch:
+            with self._frame_cond:
+                self._tail = staged
+                self._frame_cond.notify()
+
+    def _allocate_ring(self, shape):
+        """Allocate the frame ring for frames of the given shape"""
+        frame_bytes = int(np.prod(shape))
+        slots = max(4, min(MAX_RING_SLOTS, RING_BUDGET_BYTES // frame_bytes))
+        logger.info(f"Allocating frame ring: {slots} x {shape}")
+        self._ring = np.empty((slots, *shape), dtype=np.uint8)
+        self._ring_fmt = [None] * slots
+
+    def _open_writer(self, width: int, height: int) -> bool:
+        """
+        Open the hardware ffmpeg encoder, or cv2.VideoWriter as a fallback
+
+        Returns:
+            False if no writer could be opened
+        """
+        if self.hw_encoder:
+            logger.info(f"Initializing {self.hw_encoder} encoder: {width}x{height} @ {self.fps}fps")
+            # I420 needs even dimensions; odd sizes are sent as packed BGR
+            self._ffmpeg_pix_fmt = 'yuv420p' if width % 2 == 0 and height % 2 == 0 else 'bgr24'
+            if self._ffmpeg_pix_fmt == 'yuv420p':
+                self._i420_pool = [np.empty((height * 3 // 2, width), dtype=np.uint8)
+                                   for _ in range(PIPE_BATCH)]
             try:
-                self.frame_queue.get_nowait()
-                self.frame_queue.put_nowait(frame.copy())
-                logger.warning("Frame queue full, dropped oldest frame")
-            except:
-                pass
+                self._ffmpeg = subprocess.Popen([
+                    'ffmpeg',
+                    '-y',
+                    '-f', 'rawvideo',
+                    '-pix_fmt', self._ffmpeg_pix_fmt,
+                    '-s', f'{width}x{height}',
+                    '-r', str(self.fps),
+                    '-i', '-',
+                    '-c:v', self.hw_encoder,
+                    *_HW_ENCODER_ARGS[self.hw_encoder],
+                    '-pix_fmt', 'yuv420p',
+                    '-f', 'mp4',
+                    self.current_filename
+                ], stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                   bufsize=0)  # Unbuffered: frames go to the pipe with writev
+                # A failed start shows up as a broken pipe on the first write
+                # (see _flush_pipe), which switches to cv2
+                return True
+            except OSError as e:
+                logger.warning(f"Hardware encoder unavailable, using software writer: {e}")
+                self._ffmpeg = None
+
+        logger.info(f"Initializing video writer: {width}x{height} @ {self.fps}fps")
+        self.video_writer = cv2.VideoWriter(
+            self.current_filename,
+            self.fourcc,
+            self.fps,
+            (width, height)
+        )
+
+        if not self.video_writer.isOpened():
+            logger.error("Failed to open video writer")
+            return False
+        return True
+
+    def _write_frame(self, frame: np.ndarray, pix_fmt: str, pipe_out: list) -> bool:
+        """
+        Encode one frame (opening the writer on the first one)
+
+        Args:
+            frame: Frame from the ring
+            pix_fmt: Its channel order
+            pipe_out: Byte views for the ffmpeg pipe are appended here (the
+                caller sends them with one writev once PIPE_BATCH have
+                collected); cv2 frames are written directly
+
+        Returns:
+            False if the writer could not be opened
+        """
+        if self.video_writer is None and self._ffmpeg is None:
+            height, width = frame.shape[:2]
+            if not self._open_writer(width, height):
+                return False
+
+        # One colour conversion at most: straight to I420 for the encoder
+        # pipe, or to BGR for OpenCV (none if already BGR)
+        if self._ffmpeg and self._ffmpeg_pix_fmt == 'yuv420p':
+            # Convert into a preallocated buffer (no per-frame allocation)
+            dst = self._i420_pool[len(pipe_out)]
+            cv2.cvtColor(frame, _TO_I420[pix_fmt], dst=dst)
+            pipe_out.append(memoryview(dst).cast('B'))
+        else:
+            code = _TO_BGR.get(pix_fmt)
+            frame_bgr = cv2.cvtColor(frame, code) if code is not None else frame
+            if self._ffmpeg:
+                # Already-BGR frames are sent straight from the ring slot
+                pipe_out.append(memoryview(frame_bgr).cast('B'))
+            else:
+                self.video_writer.write(frame_bgr)
+                self.frames_written += 1  # Piped frames count once sent
+        return True
+
+    def _close_ffmpeg(self):
+        """Close ffmpeg's stdin and wait for it to finish the file (killed if it hangs)"""
+        try:
+            self._ffmpeg.stdin.close()
+        except OSError:
+            pass  # Encoder already gone
+        try:
+            self._ffmpeg.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            logger.warning("Encoder did not exit, killing it")
+            self._ffmpeg.kill()
+            self._ffmpeg.wait()
+        self._ffmpeg = None
+
+    def _flush_pipe(self, pipe_out: list, first: int) -> bool:
+        """
+        Send a batch to ffmpeg; if the encoder has died, switch to
+        cv2.VideoWriter and re-encode the batch from the ring
+
+        Args:
+            pipe_out: Byte views collected by _write_frame
+            first: Ring index of the batch's first frame (its slots are still busy)
+
+        Returns:
+            False if no writer is left to record with
+        """
+        try:
+            self._pipe_write(pipe_out)
+            self.frames_written += len(pipe_out)
+            return True
+        except OSError as e:
+            logger.warning(f"{self.hw_encoder} failed (exit code {self._ffmpeg.poll()}): {e}; "
+                           "restarting recording with the software writer")
+
+        # The encoder's output is unusable: start the file over with OpenCV
+        # and stop trying the hardware encoder on this recorder
+        self._close_ffmpeg()
+        self.hw_encoder = None
+        self.frames_written = 0
+        n = len(self._ring)
+        height, width = self._ring.shape[1:3]
+        if not self._open_writer(width, height):
+            return False
+        for index in range(first, first + len(pipe_out)):
+            slot = index % n
+            self._write_frame(self._ring[slot], self._ring_fmt[slot], [])
+        return True
+
+    def _pipe_write(self, views: list):
+        """Write byte views to ffmpeg's stdin with writev, resuming after short writes"""
+        fd = self._ffmpeg.stdin.fileno()
+        while views:
+            written = os.writev(fd, views)
+            # Skip fully written views, then trim the partially written one
+            done = 0
+            while done < len(views) and written >= len(views[done]):
+                written -= len(views[done])
+                done += 1
+            views = views[done:]
+            if views and written:
+                views[0] = views[0][written:]
 
     def _write_loop(self):
         """Background thread to write frames to video file"""
         try:
-            while self.is_recording or not self.frame_queue.empty():
+            while True:
+                with self._frame_cond:
+                    while self._head == self._tail and self.is_recording:
+                        self._frame_cond.wait(0.5)
+                    if self._head == self._tail:
+                        break  # Stopped and drained
+                    # Claim every committed frame in one go; add_frame won't
+                    # overwrite slots at or past _busy
+                    start, end = self._head, self._tail
+                    self._busy = start
+                    self._head = end
+
                 try:
-                    # Get frame from queue (with timeout)
-                    frame = self.frame_queue.get(timeout=0.5)
-
-                    # Initialize video writer on first frame
-                    if self.video_writer is None:
-                        height, width = frame.shape[:2]
-                        logger.info(f"Initializing video writer: {width}x{height} @ {self.fps}fps")
-
-                        self.video_writer = cv2.VideoWriter(
-                            self.current_filename,
-                            self.fourcc,
-                            self.fps,
-                            (width, height)
-                        )
-
-                        if not self.video_writer.isOpened():
-                            logger.error("Failed to open video writer")
+                    n = len(self._ring)
+                    pipe_out = []
+                    for index in range(start, end):
+                        slot = index % n
+                        if not self._write_frame(self._ring[slot], self._ring_fmt[slot], pipe_out):
                             self.is_recording = False
                             return
-
-                    # Convert RGB to BGR for OpenCV
-                    frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-
-                    # Write frame
-                    self.video_writer.write(frame_bgr)
-                    self.frames_written += 1
-
-                except queue.Empty:
-                    continue
+                        # Up to PIPE_BATCH frames per syscall; views may point into
+                        # ring slots, so those stay busy until the write returns
+                        if len(pipe_out) == PIPE_BATCH:
+                            if not self._flush_pipe(pipe_out, index + 1 - len(pipe_out)):
+                                self.is_recording = False
+                                return
+                            pipe_out = []
+                        if not pipe_out:
+                            self._busy = index + 1  # Slot done; free for reuse
+                    if pipe_out and not self._flush_pipe(pipe_out, end - len(pipe_out)):
+                        self.is_recording = False
+                        return
                 except Exception as e:
                     logger.error(f"Error writing frame: {e}")
                     import traceback
                     traceback.print_exc()
+                finally:
+                    self._busy = None
 
         except Exception as e:
             logger.error(f"Write loop error: {e}")
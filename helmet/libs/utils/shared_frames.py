@@ -0,0 +1,188 @@
+"""Shared-memory frame transport between helmet processes on the same host
+
+A FrameMeta whose format starts with SHM_PREFIX carries no pixels: its data
+field is a short "name:offset:nbytes:slot" reference into a shared memory
+block written by SharedFramePool, and the receiver maps it with
+SharedFrameReader. slot identifies the writer's slot, so the reader can drop
+the old block when a slot is reallocated under a new name.
+"""
+
+import logging
+import os
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SHM_PREFIX = "shm:"
+
+
+def encode_ref(name: str, offset: int, nbytes: int, slot: str) -> bytes:
+    """Pack a shared memory reference into FrameMeta.data"""
+    return f"{name}:{offset}:{nbytes}:{slot}".encode("ascii")
+
+
+def decode_ref(data: bytes) -> Tuple[str, int, int, str]:
+    """Unpack a reference written by encode_ref"""
+    name, offset, nbytes, slot = data.decode("ascii").rsplit(":", 3)
+    return name, int(offset), int(nbytes), slot
+
+
+class SharedFramePool:
+    """Set of shared memory slots for outgoing frames (writer side)
+
+    A slot stays owned by its frame until release() is called with that
+    frame_id (when the result arrives), so it is never overwritten while the
+    service may still be reading it. When every slot is owned, put() returns
+    None and the caller sends the pixels inline. Not thread-safe.
+    """
+
+    def __init__(self, slots: int = 4, max_age_s: float = 5.0):
+        """
+        Args:
+            slots: Number of frames that can be outstanding at once
+            max_age_s: Reclaim a slot whose result never arrived after this long
+                (e.g. the service skipped the frame); well above RPC deadlines
+        """
+        self._slots = [None] * slots
+        self._owner = [None] * slots  # frame_id in flight, None when free
+        self._since = [0.0] * slots   # monotonic time the slot was taken
+        self._next = 0
+        self._max_age_s = max_age_s
+        self._slot_prefix = f"{os.getpid()}.{id(self)}."
+
+    def _free_slot(self) -> Optional[int]:
+        """Next free (or expired) slot, round-robin from the last one used"""
+        now = time.monotonic()
+        count = len(self._slots)
+        for step in range(count):
+            index = (self._next + step) % count
+            if self._owner[index] is None or now - self._since[index] > self._max_age_s:
+                return index
+        return None
+
+    def put(self, data, frame_id: int) -> Optional[bytes]:
+        """
+        Copy one frame into a free slot
+
+        Args:
+            data: Frame bytes (any bytes-like object)
+            frame_id: Frame the slot is held for until release(frame_id)
+
+        Returns:
+            Reference to store in FrameMeta.data, or None if every slot is
+            still in flight
+        """
+        index = self._free_slot()
+        if index is None:
+            return None
+        src = memoryview(data).cast('B')
+        self._next = (index + 1) % len(self._slots)
+        self._owner[index] = frame_id
+        self._since[index] = time.monotonic()
+
+        shm = self._slots[index]
+        if shm is None or shm.size < len(src):
+            # First use, or the frame size grew (resolution change)
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+            shm = shared_memory.SharedMemory(create=True, size=len(src))
+            self._slots[index] = shm
+
+        shm.buf[:len(src)] = src
+        return encode_ref(shm.name, 0, len(src), self._slot_prefix + str(index))
+
+    def release(self, frame_id: int):
+        """Free the slot held for frame_id (no-op if it holds none)"""
+        for index, owner in enumerate(self._owner):
+            if owner == frame_id:
+                self._owner[index] = None
+                return
+
+    def close(self):
+        """Release and unlink every slot"""
+        for i, shm in enumerate(self._slots):
+            if shm is not None:
+                try:
+                    shm.close()
+                    shm.unlink()
+                except FileNotFoundError:
+                    pass
+                self._slots[i] = None
+                self._owner[i] = None
+
+
+class SharedFrameReader:
+    """Maps frames published by a SharedFramePool in another process (reader side)
+
+    Thread-safe, so one reader can serve every gRPC worker thread.
+    """
+
+    def __init__(self):
+        self._blocks: Dict[str, shared_memory.SharedMemory] = {}
+        self._slot_names: Dict[str, str] = {}  # writer slot -> current block name
+        self._lock = threading.Lock()
+
+    def view(self, data: bytes) -> Optional[np.ndarray]:
+        """
+        Zero-copy uint8 view of a referenced frame
+
+        The view is only valid until the writer reuses the slot, so copy it if
+        it has to outlive the current request.
+
+        Args:
+            data: FrameMeta.data holding a reference from SharedFramePool.put
+
+        Returns:
+            Flat uint8 array, or None if the block no longer exists
+        """
+        name, offset, nbytes, slot = decode_ref(data)
+        with self._lock:
+            shm = self._blocks.get(name)
+            if shm is None:
+                try:
+                    shm = self._attach(name)
+                except FileNotFoundError:
+                    return None
+                self._blocks[name] = shm
+                # The writer reallocated this slot: unmap the block it unlinked
+                old_name = self._slot_names.get(slot)
+                if old_name is not None and old_name != name:
+                    self._unmap(self._blocks.pop(old_name, None))
+                self._slot_names[slot] = name
+            return np.frombuffer(shm.buf, dtype=np.uint8, count=nbytes, offset=offset)
+
+    @staticmethod
+    def _attach(name: str) -> shared_memory.SharedMemory:
+        """Open an existing block without taking ownership of it"""
+        try:
+            return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+        except TypeError:
+            shm = shared_memory.SharedMemory(name=name)
+            # Otherwise this process's resource tracker would unlink the
+            # writer's block when the reader exits
+            resource_tracker.unregister(shm._name, "shared_memory")
+            return shm
+
+    @staticmethod
+    def _unmap(shm: Optional[shared_memory.SharedMemory]):
+        """Close one block's mapping"""
+        if shm is None:
+            return
+        try:
+            shm.close()
+        except BufferError:
+            pass  # A view is still alive; the mapping goes away with it
+
+    def close(self):
+        """Unmap every attached block"""
+        with self._lock:
+            for shm in self._blocks.values():
+                self._unmap(shm)
+            self._blocks.clear()
+            self._slot_names.clear()
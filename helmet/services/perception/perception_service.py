@@ -53,6 +53,7 @@ except ImportError:
 sys.path.append(str(Path(__file__).parent.parent.parent / "libs"))
 from utils.config import get_config
 from utils.logging_utils import setup_logging, log_performance
+from utils.shared_frames import SHM_PREFIX, SharedFrameReader
 from messages import helmet_pb2, helmet_pb2_grpc
 
 logger = logging.getLogger(__name__)
@@ -514,6 +515,7 @@ class PerceptionServiceImpl(helmet_pb2_grpc.PerceptionServiceServicer):
     def __init__(self, config):
         self.config = config
         self.detector = ObjectDetector(config)
+        self._shm_reader = SharedFrameReader()  # Frames sent by reference from local clients
         logger.info("Perception service initialized")
 
     def Infer(self, request, context):
@@ -590,12 +592,19 @@ class PerceptionServiceImpl(helmet_pb2_grpc.PerceptionServiceServicer):
             if not frame_meta.data:
                 return None
 
-            # Decode frame data
-            frame_data = np.frombuffer(frame_meta.data, dtype=np.uint8)
+            # Decode frame data (pixels inline, or a shared memory reference)
+            pixel_format = frame_meta.format
+            if pixel_format.startswith(SHM_PREFIX):
+                pixel_format = pixel_format[len(SHM_PREFIX):]
+                frame_data = self._shm_reader.view(frame_meta.data)
+                if frame_data is None:
+                    return None
+            else:
+                frame_data = np.frombuffer(frame_meta.data, dtype=np.uint8)
 
-            if frame_meta.format == 'RGB':
+            if pixel_format == 'RGB':
                 frame = frame_data.reshape((frame_meta.height, frame_meta.width, 3))
-            elif frame_meta.format == 'BGR':
+            elif pixel_format == 'BGR':
                 frame = frame_data.reshape((frame_meta.height, frame_meta.width, 3))
                 frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
             else:
@@ -618,10 +627,14 @@ def serve():
     setup_logging('perception-service', log_level, log_dir)
 
     # Create gRPC server with increased message size for high-res frames
-    # 50MB max message size to handle high-resolution camera frames
+    # 50MB max message size to handle high-resolution camera frames.
+    # Accept the client's 10s keepalive pings, also between requests, instead
+    # of answering them with GOAWAY (too_many_pings)
     options = [
         ('grpc.max_send_message_length', 50 * 1024 * 1024),
         ('grpc.max_receive_message_length', 50 * 1024 * 1024),
+        ('grpc.keepalive_permit_without_calls', 1),
+        ('grpc.http2.min_ping_interval_without_data_ms', 10000),
     ]
     server = grpc.server(futures.ThreadPoolExecutor(max_workers=10), options=options)
     perception_service = PerceptionServiceImpl(config)
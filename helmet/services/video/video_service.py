@@ -488,10 +488,15 @@ def serve():
     setup_logging('video-service', log_level, log_dir)
 
     # Create gRPC server with increased message size for high-res frames
-    # 50MB max message size to handle high-resolution camera frames
+    # 50MB max message size to handle high-resolution camera frames.
+    # A 1MB HTTP/2 window keeps frame streams from stalling on the 64KB
+    # default, and idle keepalive pings from clients are accepted
     options = [
         ('grpc.max_send_message_length', 50 * 1024 * 1024),
         ('grpc.max_receive_message_length', 50 * 1024 * 1024),
+        ('grpc.http2.lookahead_bytes', 1024 * 1024),
+        ('grpc.keepalive_permit_without_calls', 1),
+        ('grpc.http2.min_ping_interval_without_data_ms', 10000),
     ]
     server = grpc.server(futures.ThreadPoolExecutor(max_workers=10), options=options)
     video_service = VideoServiceImpl(config)